@@ -0,0 +1,129 @@
+import asyncio
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from rich.console import Console
+from app.screens.story import STORY
+
+FORMATS = {"svg": ".svg", "ansi": ".ans", "txt": ".txt"}
+EXPORT_SIZE = (100, 40)
+
+def load_snapshot(path):
+    with open(path) as f:
+        stats = json.load(f)
+    # JSON turns the int hour keys into strings; the heatmap looks them up by int.
+    hourly = stats.get("hourly_breakdown")
+    if hourly:
+        stats["hourly_breakdown"] = {int(h): v for h, v in hourly.items()}
+    return stats
+
+def save_snapshot(stats, path):
+    path = Path(path)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump(stats, f, default=str)
+    os.replace(tmp, path)
+
+def snapshot_labels(paths):
+    """One output directory name per snapshot path, unique across the fleet.
+
+    The file stem when that is unique; otherwise parent directory names are
+    prepended (a/2024.json, b/2024.json -> a-2024, b-2024) until the labels
+    differ, and the same file given twice gets a numeric suffix.
+    """
+    parts = [Path(p).resolve().parts[:-1] + (Path(p).stem,) for p in paths]
+    depth = [1] * len(parts)
+    while True:
+        labels = ["-".join(p[-d:]) for p, d in zip(parts, depth)]
+        seen = {}
+        for i, label in enumerate(labels):
+            seen.setdefault(label, []).append(i)
+        grown = False
+        for same in seen.values():
+            if len({parts[i] for i in same}) < 2:
+                continue
+            for i in same:
+                if depth[i] < len(parts[i]) - 1:
+                    depth[i] += 1
+                    grown = True
+        if not grown:
+            break
+    counts = {}
+    for i, label in enumerate(labels):
+        counts[label] = counts.get(label, 0) + 1
+        if counts[label] > 1:
+            labels[i] = f"{label}-{counts[label]}"
+    return labels
+
+def card_path(out_dir, index, name, fmt):
+    return Path(out_dir) / f"{index:02d}-{name}{FORMATS[fmt]}"
+
+def render_text(stats, names, fmt, out_dir, size=EXPORT_SIZE):
+    # Rich alone is enough for ANSI and plain text: record the renderable at
+    # the export width and dump it with or without styles.
+    from app.screens.slide import build
+    written = []
+    for index, name in names:
+        console = Console(record=True, width=size[0], file=io.StringIO(),
+                          force_terminal=True, color_system="truecolor")
+        console.print(build(name, stats), justify="center")
+        path = card_path(out_dir, index, name, fmt)
+        path.write_text(console.export_text(styles=fmt == "ansi"))
+        written.append(path)
+    return written
+
+async def render_svg(stats, names, out_dir, size=EXPORT_SIZE):
+    # One headless app per job; every slide is shown on the same SlideScreen
+    # and captured with Textual's own screenshot export.
+    from app.macwrap_app import MacWrap
+    app = MacWrap(stats=stats, reduced_motion=True)
+    written = []
+    async with app.run_test(size=size) as pilot:
+        await pilot.pause()
+        screen = app.screen
+        screen.PRERENDER = False
+        screen.AUTO_ADVANCE = False
+        for index, name in names:
+            screen.show(name)
+            await pilot.pause()
+            path = card_path(out_dir, index, name, "svg")
+            path.write_text(app.export_screenshot(title=f"macwrap - {screen.slide['title']}"))
+            written.append(path)
+    return written
+
+def export_job(source, names, fmt, out_dir, size=EXPORT_SIZE):
+    # Runs in a worker process. Snapshots travel as paths so a big fleet is
+    # only ever loaded one snapshot at a time per worker.
+    stats = load_snapshot(source) if isinstance(source, (str, Path)) else source
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    if fmt == "svg":
+        return asyncio.run(render_svg(stats, names, out_dir, size))
+    return render_text(stats, names, fmt, out_dir, size)
+
+def plan_jobs(snapshots, out_dir, fmt, workers, size=EXPORT_SIZE):
+    """Split the export into (source, slides, fmt, out_dir, size) jobs.
+
+    snapshots is a list of (label, stats dict or snapshot path). With one
+    snapshot its cards go straight into out_dir, otherwise into out_dir/label.
+    Slides are dealt round-robin into enough chunks to keep every worker busy;
+    a large fleet ends up with one job (one app start) per snapshot.
+    """
+    slides = list(enumerate(slide["name"] for slide in STORY))
+    chunks = max(1, min(len(slides), -(-workers // len(snapshots))))
+    jobs = []
+    for label, source in snapshots:
+        target = Path(out_dir) if len(snapshots) == 1 else Path(out_dir) / label
+        for i in range(chunks):
+            jobs.append((source, slides[i::chunks], fmt, target, size))
+    return jobs
+
+def export_cards(snapshots, out_dir, fmt="svg", workers=None, size=EXPORT_SIZE):
+    workers = workers or os.cpu_count() or 1
+    jobs = plan_jobs(snapshots, out_dir, fmt, workers, size)
+    written = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        for paths in pool.map(export_job, *zip(*jobs)):
+            written.extend(paths)
+    return sorted(written)
@@ -1,8 +1,11 @@
 from textual.app import App
-from app.screens.intro import IntroScreen
+from app.screens.registry import lazy_screens
 from app.utils.stats import get_all_stats
+from app.utils.screen_time import FULL_DISK_ACCESS_HELP, access_denied
 
 class MacWrap(App):
+    SCREENS = lazy_screens()
+
     CSS = """
     Screen {
         background: #0d1117;
@@ -19,19 +22,21 @@ class MacWrap(App):
     }
     """
 
+    def __init__(self, stats=None, reduced_motion=False):
+        super().__init__()
+        # Pre-computed stats (benchmarks, exports) skip collection entirely.
+        self.stats = stats
+        self.reduced_motion = reduced_motion
+        if reduced_motion:
+            self.animation_level = "none"
+
     def on_mount(self):
         # Compute stats once at startup and attach to app for screens to use.
         try:
-            self.stats = get_all_stats()
+            if self.stats is None:
+                self.stats = get_all_stats()
         except Exception as e:
-            error_msg = str(e)
-            if "Operation not permitted" in error_msg or "Permission denied" in error_msg:
-                error_msg = (
-                    "Access to Screen Time database denied.\n\n"
-                    "1. Go to System Settings > Privacy & Security > Full Disk Access\n"
-                    "2. Enable it for your Terminal (iTerm/Terminal)\n"
-                    "3. Restart Terminal and try again"
-                )
+            error_msg = FULL_DISK_ACCESS_HELP if access_denied(e) else str(e)
             
             self.stats = {
                 "year": 2025,
@@ -42,6 +47,7 @@ class MacWrap(App):
                 "max_streak": 0,
                 "weekend_hours": 0,
                 "weekday_hours": 0,
+                "daily_hours": {},
                 "hourly_breakdown": {h: 0 for h in range(24)},
                 "peak_hour": 12,
                 "late_night_hours": 0,
@@ -51,9 +57,10 @@ class MacWrap(App):
                 "wtf_spike_day": (None, 0),
                 "personality": "Mac User",
                 "command_count": 0,
-                "file_stats": {"total": 0, "top_types": []},
+                "file_stats": {"total": 0, "top_types": [], "truncated": False},
                 "power_events": {"sleeps": 0, "wakes": 0, "reboots": 0},
+                "awake_usage": {},
                 "error": error_msg
             }
         self.dark = True
-        self.push_screen(IntroScreen())
+        self.push_screen("story")
@@ -0,0 +1,18 @@
+def render(stats):
+    cs = stats.get('context_switches') or {}
+    if not cs.get('switches'):
+        return "[yellow]No context switching data[/yellow]\n\n[dim]Press SPACE or ENTER[/dim]"
+    pairs = "".join(
+        f"[bold]{a}[/bold] → [bold]{b}[/bold] - {n:,} times\n" for a, b, n in cs.get('top_pairs', [])[:3]
+    )
+    day, day_switches = cs.get('busiest_day', (None, 0))
+    busiest = f"Busiest day: [bold]{day}[/bold] with {day_switches:,} switches\n\n" if day else ""
+    content = (
+        f"[bold cyan]Context Switching[/bold cyan]\n\n"
+        f"[bold white]{cs['switches']:,} app switches[/bold white]\n"
+        f"about [bold]{cs['per_active_hour']}[/bold] every hour you were active\n\n"
+        f"{busiest}"
+        f"[cyan]You bounced most between[/cyan]\n{pairs}\n"
+        "[dim]Press SPACE or ENTER to continue[/dim]"
+    )
+    return content
@@ -0,0 +1,108 @@
+from datetime import date, timedelta
+from functools import lru_cache
+from rich.console import Group
+from rich.measure import Measurement
+from rich.segment import Segment
+from rich.style import Style
+from rich.text import Text
+
+# GitHub-style intensity ramp, index 0 is "no usage".
+LEVEL_STYLES = tuple(Style(color=c) for c in ("#161b22", "#0e4429", "#006d32", "#26a641", "#39d353"))
+LABEL_STYLE = Style(color="#8b949e")
+MONTHS = "Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec".split()
+WEEKDAYS = ("Mon", "", "Wed", "", "Fri", "", "Sun")
+
+def level(value, peak):
+    if not value or not peak:
+        return 0
+    return 1 + min(3, int(value / peak * 4))
+
+class Heatmap:
+    """Rich renderable over a pre-built tuple of segment lines.
+
+    The lines are built once per data set (see the cached builders below), so
+    repaints and resizes just replay the same segments.
+    """
+
+    def __init__(self, lines):
+        self.lines = lines
+        self.width = max((sum(s.cell_length for s in line) for line in lines), default=0)
+
+    def __rich_measure__(self, console, options):
+        return Measurement(self.width, self.width)
+
+    def __rich_console__(self, console, options):
+        newline = Segment.line()
+        for line in self.lines:
+            yield from line
+            yield newline
+
+@lru_cache(maxsize=8)
+def hourly_lines(hours):
+    peak = max(hours)
+    cells = [Segment("   ", LABEL_STYLE)]
+    for value in hours:
+        cells.append(Segment("██", LEVEL_STYLES[level(value, peak)]))
+    labels = "".join(f"{h:<2}" if h % 3 == 0 else "  " for h in range(24))
+    return (tuple(cells), (Segment("   " + labels, LABEL_STYLE),))
+
+@lru_cache(maxsize=8)
+def calendar_lines(year, values):
+    # values: one entry per day of the year, Jan 1 first.
+    jan1 = date(year, 1, 1)
+    offset = jan1.weekday()
+    weeks = (offset + len(values) + 6) // 7
+    peak = max(values) if values else 0
+    grid = [[Segment(" ")] * weeks for _ in range(7)]
+    for i, value in enumerate(values):
+        col, row = divmod(offset + i, 7)
+        grid[row][col] = Segment("■", LEVEL_STYLES[level(value, peak)])
+
+    header = [" "] * weeks
+    for month in range(12):
+        col = (offset + (date(year, month + 1, 1) - jan1).days) // 7
+        if col + 3 <= weeks:
+            header[col:col + 3] = MONTHS[month]
+    lines = [(Segment("    " + "".join(header)[:weeks], LABEL_STYLE),)]
+    for row in range(7):
+        lines.append((Segment(f"{WEEKDAYS[row]:<4}", LABEL_STYLE), *grid[row]))
+    return tuple(lines)
+
+def render_hourly(stats):
+    hourly = stats.get("hourly_breakdown", {})
+    hours = tuple(float(hourly.get(h, 0) or 0) for h in range(24))
+    if not any(hours):
+        return "[bold cyan]Your Hourly Heatmap[/bold cyan]\n\n[yellow]No hourly data available[/yellow]\n\n[dim]Press SPACE or ENTER to continue[/dim]"
+    peak = stats.get("peak_hour", hours.index(max(hours)))
+    am_pm = "AM" if peak < 12 else "PM"
+    display_hour = 12 if peak in (0, 12) else peak % 12
+    return Group(
+        Text.from_markup("[bold cyan]Your Hourly Heatmap[/bold cyan]\n", justify="center"),
+        Heatmap(hourly_lines(hours)),
+        Text.from_markup(
+            f"\nPeak hour: [bold white]{display_hour}{am_pm}[/bold white]\n\n"
+            "[dim]Press SPACE or ENTER to continue[/dim]",
+            justify="center",
+        ),
+    )
+
+def render_calendar(stats):
+    year = stats.get("year", 2025)
+    daily = stats.get("daily_hours", {})
+    if not daily:
+        return "[bold green]Your Year in Squares[/bold green]\n\n[yellow]No daily data available[/yellow]\n\n[dim]Press SPACE or ENTER to continue[/dim]"
+    day = date(year, 1, 1)
+    values = []
+    while day.year == year:
+        values.append(float(daily.get(day.isoformat(), 0) or 0))
+        day += timedelta(days=1)
+    active = sum(1 for v in values if v)
+    return Group(
+        Text.from_markup("[bold green]Your Year in Squares[/bold green]\n", justify="center"),
+        Heatmap(calendar_lines(year, tuple(values))),
+        Text.from_markup(
+            f"\n[bold white]{active}[/bold white] active days in {year}\n\n"
+            "[dim]Press SPACE or ENTER to continue[/dim]",
+            justify="center",
+        ),
+    )
@@ -1,32 +1,23 @@
-from textual.screen import Screen
-from textual.widgets import Static, Header, Footer
-from textual.containers import Center, Middle
-from textual import events, on
-from app.screens.personality import PersonalityScreen
-
-class PowerEventsScreen(Screen):
-    def compose(self):
-        yield Header()
-        with Center():
-            with Middle():
-                stats = self.app.stats
-                pe = stats.get('power_events', {"sleeps":0,"wakes":0,"reboots":0})
-                content = (
-                    f"[bold yellow]⚡ Power Events[/bold yellow]\n\n"
-                    f"Sleeps: [bold]{pe.get('sleeps',0)}[/bold]\n"
-                    f"Wakes: [bold]{pe.get('wakes',0)}[/bold]\n"
-                    f"Reboots: [bold]{pe.get('reboots',0)}[/bold]\n\n"
-                    "[italic]Your Mac's sleep cycle[/italic]\n\n"
-                    "[dim]Press SPACE or ENTER to continue[/dim]"
-                )
-                yield Static(content, id="power")
-        yield Footer()
-
-    def on_mount(self):
-        w = self.query_one("#power")
-        w.styles.opacity = 0
-        w.styles.animate("opacity", value=1.0, duration=1.8)
-
-    def on_key(self, event):
-        if event.key in ("space", "enter"):
-            self.app.push_screen(PersonalityScreen())
+def render(stats):
+    pe = stats.get('power_events', {"sleeps":0,"wakes":0,"reboots":0})
+    extra = ""
+    if pe.get('dark_wakes'):
+        extra += f"Dark wakes: [bold]{pe['dark_wakes']}[/bold]\n"
+    if pe.get('median_sleep_minutes'):
+        hours, minutes = divmod(int(pe['median_sleep_minutes']), 60)
+        extra += f"Typical nap: [bold]{hours}h {minutes:02d}m[/bold]\n"
+    awake = stats.get('awake_usage') or {}
+    if awake.get('idle_awake_hours'):
+        extra += f"Awake but idle: [bold]{int(awake['idle_awake_hours'])} hrs[/bold]\n"
+    if awake.get('top_before_sleep'):
+        extra += f"Last app before sleep: [bold]{awake['top_before_sleep'][0][0]}[/bold]\n"
+    content = (
+        f"[bold yellow]⚡ Power Events[/bold yellow]\n\n"
+        f"Sleeps: [bold]{pe.get('sleeps',0)}[/bold]\n"
+        f"Wakes: [bold]{pe.get('wakes',0)}[/bold]\n"
+        f"Reboots: [bold]{pe.get('reboots',0)}[/bold]\n"
+        f"{extra}\n"
+        "[italic]Your Mac's sleep cycle[/italic]\n\n"
+        "[dim]Press SPACE or ENTER to continue[/dim]"
+    )
+    return content
@@ -0,0 +1,20 @@
+from importlib import import_module
+
+# Screen name -> "module:Class". Nothing here is imported until the screen is
+# first pushed, so loading the app doesn't drag in the whole story graph.
+# Slide renderers in app.screens.story are resolved the same way.
+SCREENS = {
+    "story": "app.screens.slide:SlideScreen",
+}
+
+def resolve(path):
+    module, _, attr = path.partition(":")
+    return getattr(import_module(module), attr)
+
+def lazy_screen(path):
+    return lambda: resolve(path)()
+
+def lazy_screens():
+    # Textual calls these factories on the first push_screen(name) and
+    # keeps the instance installed afterwards.
+    return {name: lazy_screen(path) for name, path in SCREENS.items()}
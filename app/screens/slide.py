@@ -0,0 +1,110 @@
+from rich.text import Text
+from textual.screen import Screen
+from textual.widgets import Static, Header, Footer
+from textual.containers import Center, Middle
+from app.screens.registry import resolve
+from app.screens.story import SLIDES
+
+FORWARD_KEYS = ("space", "enter", "right")
+BACK_KEYS = ("left", "backspace")
+# The last slide (credits) says "Press SPACE to exit"; ENTER/RIGHT held
+# down to skip through the story shouldn't quit past it.
+EXIT_KEYS = ("space",)
+
+def animate_in(w, slide):
+    # Reset whatever the previous slide left behind before tweening in.
+    w.styles.offset = (0, 0)
+    w.styles.rotate = 0
+    if w.app.animation_level == "none":
+        # Reduced motion: land on the final frame in a single paint.
+        w.styles.opacity = 1.0
+        return
+    w.styles.opacity = 0
+    duration = slide["duration"]
+    w.styles.animate("opacity", value=1.0, duration=duration)
+    if slide["animation"] == "bounce":
+        w.styles.offset_y = 5
+        w.styles.animate("offset_y", value=0, duration=duration * 0.8, easing="out_bounce")
+    elif slide["animation"] == "rotate":
+        w.styles.rotate = -8
+        w.styles.animate("rotate", value=0, duration=duration, easing="out_back")
+
+def build(name, stats):
+    content = resolve(SLIDES[name]["render"])(stats)
+    # Parse markup here rather than in Static.update so the work can happen
+    # off the UI thread.
+    return Text.from_markup(content) if isinstance(content, str) else content
+
+class SlideScreen(Screen):
+    """Plays the story on a single screen by swapping content into one widget."""
+
+    # Build the next slide in a background thread while the current one animates.
+    PRERENDER = True
+    # Follow a slide's auto_advance timer; exports turn this off to hold a slide.
+    AUTO_ADVANCE = True
+
+    def __init__(self, start="intro"):
+        super().__init__()
+        self.slide = SLIDES[start]
+        self.history = []
+        self.rendered = {}
+        self._advance_timer = None
+
+    def compose(self):
+        yield Header()
+        with Center():
+            with Middle():
+                yield Static(id="slide")
+        yield Footer()
+
+    def on_mount(self):
+        self.show(self.slide["name"])
+
+    def content(self, name):
+        # Rendered once per slide; going back and forth reuses the result.
+        # Falls back to building inline if the prerender hasn't landed yet.
+        if name not in self.rendered:
+            self.rendered[name] = build(name, self.app.stats)
+        return self.rendered[name]
+
+    def prerender(self, name):
+        if name not in self.rendered:
+            self.rendered[name] = build(name, self.app.stats)
+
+    def show(self, name):
+        if self._advance_timer is not None:
+            self._advance_timer.stop()
+            self._advance_timer = None
+        self.slide = SLIDES[name]
+        self.sub_title = self.slide["title"]
+        w = self.query_one("#slide", Static)
+        w.update(self.content(name))
+        animate_in(w, self.slide)
+        upcoming = self.slide["next"]
+        if self.PRERENDER and upcoming and upcoming not in self.rendered:
+            self.run_worker(lambda: self.prerender(upcoming), thread=True, group="prerender")
+        if self.AUTO_ADVANCE and self.slide.get("auto_advance"):
+            self._advance_timer = self.set_timer(self.slide["auto_advance"], self.forward)
+
+    def forward(self):
+        if self.slide["next"] is None:
+            self.app.exit()
+            return
+        self.history.append(self.slide["name"])
+        self.show(self.slide["next"])
+
+    def back(self):
+        # Skip auto-advancing slides so BACK doesn't bounce straight forward again.
+        while self.history:
+            name = self.history.pop()
+            if not SLIDES[name].get("auto_advance"):
+                self.show(name)
+                return
+
+    def on_key(self, event):
+        if event.key in FORWARD_KEYS:
+            if self.slide["next"] is None and event.key not in EXIT_KEYS:
+                return
+            self.forward()
+        elif event.key in BACK_KEYS:
+            self.back()
@@ -0,0 +1,46 @@
+# The whole wrap as data. Each slide names its renderer ("module:function",
+# called with the stats dict), how it animates in, and where SPACE/ENTER goes.
+# `auto_advance` moves on by itself after that many seconds; `next: None` ends
+# the story.
+STORY = [
+    {"name": "intro", "title": "Intro", "render": "app.screens.intro:render",
+     "animation": "fade", "duration": 2.0, "auto_advance": 3.5, "next": "loading"},
+    {"name": "loading", "title": "Loading", "render": "app.screens.loading:render",
+     "animation": "fade", "duration": 1.8, "auto_advance": 3, "next": "total_time"},
+    {"name": "total_time", "title": "Total Time", "render": "app.screens.total_time:render",
+     "animation": "fade", "duration": 2.0, "next": "top_apps"},
+    {"name": "top_apps", "title": "Top Apps", "render": "app.screens.top_apps:render",
+     "animation": "bounce", "duration": 1.5, "next": "streak"},
+    {"name": "streak", "title": "Streak", "render": "app.screens.streak:render",
+     "animation": "fade", "duration": 1.8, "next": "calendar_heatmap"},
+    {"name": "calendar_heatmap", "title": "Year in Squares", "render": "app.screens.heatmap:render_calendar",
+     "animation": "fade", "duration": 1.5, "next": "focus"},
+    {"name": "focus", "title": "Deep Focus", "render": "app.screens.focus:render",
+     "animation": "fade", "duration": 1.8, "next": "weekend_weekday"},
+    {"name": "weekend_weekday", "title": "Weekend vs Weekday", "render": "app.screens.weekend_weekday:render",
+     "animation": "fade", "duration": 1.8, "next": "hourly_heatmap"},
+    {"name": "hourly_heatmap", "title": "Hourly Heatmap", "render": "app.screens.heatmap:render_hourly",
+     "animation": "fade", "duration": 1.5, "next": "forgotten_app"},
+    {"name": "forgotten_app", "title": "Forgotten App", "render": "app.screens.forgotten_app:render",
+     "animation": "fade", "duration": 1.8, "next": "spike"},
+    {"name": "spike", "title": "Spike Day", "render": "app.screens.spike:render",
+     "animation": "fade", "duration": 1.8, "next": "late_night"},
+    {"name": "late_night", "title": "Late Nights", "render": "app.screens.late_night:render",
+     "animation": "fade", "duration": 1.8, "next": "longest_session"},
+    {"name": "longest_session", "title": "Longest Session", "render": "app.screens.longest_session:render",
+     "animation": "fade", "duration": 1.8, "next": "context_switching"},
+    {"name": "context_switching", "title": "Context Switching", "render": "app.screens.context_switching:render",
+     "animation": "bounce", "duration": 1.5, "next": "command_line"},
+    {"name": "command_line", "title": "Command Line", "render": "app.screens.command_line:render",
+     "animation": "fade", "duration": 1.8, "next": "power_events"},
+    {"name": "power_events", "title": "Power Events", "render": "app.screens.power_events:render",
+     "animation": "fade", "duration": 1.8, "next": "personality"},
+    {"name": "personality", "title": "Personality", "render": "app.screens.personality:render",
+     "animation": "rotate", "duration": 2.0, "next": "finale"},
+    {"name": "finale", "title": "Finale", "render": "app.screens.finale:render",
+     "animation": "fade", "duration": 2.5, "next": "credits"},
+    {"name": "credits", "title": "Credits", "render": "app.screens.credits:render",
+     "animation": "fade", "duration": 1.5, "next": None},
+]
+
+SLIDES = {slide["name"]: slide for slide in STORY}
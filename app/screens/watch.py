@@ -0,0 +1,25 @@
+from rich.console import Group
+from rich.text import Text
+from app.screens.heatmap import Heatmap, hourly_lines
+from app.utils.screen_time import clean_app_name
+
+def app_lines(apps):
+    if not apps:
+        return "[dim]nothing yet[/dim]\n"
+    return "".join(f"[bold]{clean_app_name(app)}[/bold] - {hours:.1f} hrs\n" for app, hours in apps)
+
+def render(snapshot):
+    hours = tuple(snapshot["hourly"])
+    parts = [
+        Text.from_markup(
+            f"[bold cyan]Today[/bold cyan]  [bold white]{snapshot['today_hours']:.1f} hrs[/bold white]"
+            f"     [bold magenta]This week[/bold magenta]  [bold white]{snapshot['week_hours']:.1f} hrs[/bold white]\n\n"
+            f"[cyan]Top apps today[/cyan]\n{app_lines(snapshot['top_today'])}\n"
+            f"[magenta]Top apps this week[/magenta]\n{app_lines(snapshot['top_week'])}",
+            justify="center",
+        ),
+    ]
+    if any(hours):
+        parts.append(Heatmap(hourly_lines(hours)))
+    parts.append(Text.from_markup(f"\n[dim]{snapshot['date']:%A %d %B} - press Q to quit[/dim]", justify="center"))
+    return Group(*parts)
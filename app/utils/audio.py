@@ -1,8 +1,132 @@
+import queue
+import shutil
 import subprocess
 import threading
+import time
 from pathlib import Path
 
+SOUNDS_DIR = Path(__file__).parent.parent / "assets" / "sounds"
+
+# A cue that waited longer than this is no longer in sync with the screen.
+STALE_AFTER = 0.25
+QUEUE_SIZE = 4
+
+class CommandBackend:
+    """Plays a file by spawning a player command (afplay, paplay, aplay)."""
+
+    def __init__(self, argv, extensions):
+        self.argv = argv
+        self.extensions = extensions
+
+    def play(self, path):
+        return subprocess.Popen(
+            [*self.argv, str(path)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+class NullBackend:
+    """Plays nothing; remembers what it was asked to play."""
+
+    extensions = (".mp3", ".wav", ".aiff")
+
+    def __init__(self):
+        self.played = []
+
+    def play(self, path):
+        self.played.append(path)
+        return None
+
+BACKENDS = {
+    "afplay": lambda: CommandBackend(["afplay"], (".mp3", ".aiff", ".wav", ".m4a")),
+    "paplay": lambda: CommandBackend(["paplay"], (".wav", ".ogg", ".flac")),
+    "aplay": lambda: CommandBackend(["aplay", "-q"], (".wav",)),
+}
+
+def detect_backend():
+    for name, factory in BACKENDS.items():
+        if shutil.which(name):
+            return factory()
+    return NullBackend()
+
+def resolve_sounds(directory, extensions):
+    # name -> file, preferring the backend's formats in order. Done once, so
+    # cueing a sound never touches the filesystem.
+    sounds = {}
+    if directory.is_dir():
+        for ext in reversed(extensions):
+            for path in directory.glob(f"*{ext}"):
+                sounds[path.stem] = path
+    return sounds
+
+class AudioPlayer:
+    """One long-lived worker thread fed by a small queue of cues.
+
+    A full queue drops its oldest cue, a cue that waited past STALE_AFTER is
+    skipped, and a new cue cuts off the one still playing, so rapid key
+    presses never pile up player processes.
+    """
+
+    def __init__(self, backend=None, sounds_dir=SOUNDS_DIR, stale_after=STALE_AFTER, on_start=None):
+        self.backend = backend or detect_backend()
+        self.sounds = resolve_sounds(Path(sounds_dir), self.backend.extensions)
+        self.stale_after = stale_after
+        # on_start(name, requested_at, started_at), for latency measurements.
+        self.on_start = on_start
+        self.dropped = 0
+        self._queue = queue.Queue(QUEUE_SIZE)
+        self._current = None
+        self._thread = threading.Thread(target=self._run, name="macwrap-audio", daemon=True)
+        self._thread.start()
+
+    def cue(self, name):
+        if name not in self.sounds:
+            return
+        item = (name, time.monotonic())
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join(timeout=1)
+        self._stop_current()
+
+    def _stop_current(self):
+        if self._current is not None and self._current.poll() is None:
+            self._current.kill()
+            self._current.wait()
+        self._current = None
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            name, requested_at = item
+            if time.monotonic() - requested_at > self.stale_after:
+                self.dropped += 1
+                continue
+            self._stop_current()
+            try:
+                self._current = self.backend.play(self.sounds[name])
+            except OSError:
+                continue
+            if self.on_start is not None:
+                self.on_start(name, requested_at, time.monotonic())
+
+_player = None
+
 def play_sound(name):
-    sound_path = Path(__file__).parent.parent / "assets" / "sounds" / f"{name}.mp3"
-    if sound_path.exists():
-        threading.Thread(target=lambda: subprocess.call(["afplay", str(sound_path)]), daemon=True).start()
+    global _player
+    if _player is None:
+        _player = AudioPlayer()
+    _player.cue(name)
@@ -0,0 +1,249 @@
+import array
+import calendar
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from pathlib import Path
+from app.utils.screen_time import CORE_DATA_EPOCH
+from app.utils.session_store import open_source_db, source_identity
+from app.utils.storage import data_dir
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Usage sessions as columns, one file per month ("2025-03.cols"):
+#
+#   header   magic, version, row count            16 bytes
+#   starts   int64 unix seconds                   8 * n
+#   durations int32 seconds                       4 * n
+#   apps     uint16 code into apps.txt            2 * n
+#
+# Each column starts on its own alignment, so a mapped file can be cast to
+# typed memoryviews (or NumPy arrays) without copying or building per-row
+# objects. Everything is little-endian.
+MAGIC = b"MWC1"
+VERSION = 1
+HEADER = struct.Struct("<4sIQ")
+DICTIONARY = "apps.txt"
+# Which database the files were last converted from, and its largest Z_PK
+# then; `macwrap query` only trusts the files while both still match.
+SOURCE_MARK = "source.json"
+MAX_APPS = 0xFFFF
+
+def columns_dir():
+    path = data_dir() / "columns"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+def month_span(unix_seconds):
+    # (key, first second, first second of the next month), UTC.
+    t = time.gmtime(unix_seconds)
+    year, month = t.tm_year, t.tm_mon
+    start = calendar.timegm((year, month, 1, 0, 0, 0))
+    end = calendar.timegm((year + month // 12, month % 12 + 1, 1, 0, 0, 0))
+    return f"{year}-{month:02d}", start, end
+
+def load_dictionary(root):
+    try:
+        return Path(root, DICTIONARY).read_text().splitlines()
+    except FileNotFoundError:
+        return []
+
+def save_dictionary(root, names):
+    path = Path(root, DICTIONARY)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text("".join(f"{name}\n" for name in names))
+    os.replace(tmp, path)
+
+def _le(column):
+    if sys.byteorder == "big":
+        column = array.array(column.typecode, column)
+        column.byteswap()
+    return column
+
+def write_month(path, starts, durations, apps):
+    path = Path(path)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(starts)))
+        for column in (starts, durations, apps):
+            _le(column).tofile(f)
+    os.replace(tmp, path)
+
+def convert_sessions(sessions, root=None):
+    """Add (bundle_id, start, end) sessions, unix seconds, to the month partitions.
+
+    New rows are merged into any existing partition, deduplicated on
+    (app, start), and existing dictionary codes are kept. knowledgeC only
+    holds a few weeks, so a month converted earlier keeps the rows that have
+    since aged out of the source. Returns {month: rows added}.
+    """
+    root = Path(root) if root else columns_dir()
+    root.mkdir(parents=True, exist_ok=True)
+    names = load_dictionary(root)
+    codes = {name: i for i, name in enumerate(names)}
+    months = {}
+    # Sessions usually arrive in start order, so the month only needs
+    # working out again when a start leaves the current one.
+    span_start = span_end = 0
+    columns = None
+    for app, start, end in sessions:
+        code = codes.get(app)
+        if code is None:
+            if len(names) >= MAX_APPS:
+                raise ValueError(f"more than {MAX_APPS} distinct apps")
+            code = codes[app] = len(names)
+            names.append(app)
+        start = int(start)
+        if not span_start <= start < span_end:
+            key, span_start, span_end = month_span(start)
+            columns = months.get(key)
+            if columns is None:
+                columns = months[key] = (array.array("q"), array.array("i"), array.array("H"))
+        columns[0].append(start)
+        columns[1].append(min(int(end) - start, 0x7FFFFFFF))
+        columns[2].append(code)
+    # Dictionary first: a partition must never reference a code it lacks.
+    save_dictionary(root, names)
+    added = {}
+    for key, columns in months.items():
+        added[key] = merge_month(root / f"{key}.cols", *columns)
+    return added
+
+def merge_month(path, starts, durations, apps):
+    # (start, app) -> duration, existing rows first so they win over repeats.
+    rows = {}
+    if path.exists():
+        with MonthColumns(path) as month:
+            for start, duration, code in zip(month.starts, month.durations, month.apps):
+                rows[start, code] = duration
+    before = len(rows)
+    for start, duration, code in zip(starts, durations, apps):
+        rows.setdefault((start, code), duration)
+    if len(rows) == before:
+        return 0
+    ordered = sorted(rows)
+    write_month(
+        path,
+        array.array("q", (start for start, _ in ordered)),
+        array.array("i", (rows[row] for row in ordered)),
+        array.array("H", (code for _, code in ordered)),
+    )
+    return len(rows) - before
+
+def source_mark(conn, db_path):
+    newest = conn.execute("SELECT MAX(Z_PK) FROM ZOBJECT").fetchone()[0] or 0
+    return [source_identity(db_path), newest]
+
+def columns_current(root, db_path):
+    """True if the files in root hold everything db_path has right now."""
+    try:
+        saved = json.loads(Path(root, SOURCE_MARK).read_text())
+    except (OSError, ValueError):
+        return False
+    with open_source_db(db_path) as conn:
+        return saved == source_mark(conn, db_path)
+
+def convert_db(db_path, root=None):
+    # knowledgeC.db or macwrap's session store; both use the ZOBJECT layout.
+    root = Path(root) if root else columns_dir()
+    with open_source_db(db_path) as conn:
+        # Taken before the rows: a session added meanwhile only makes the
+        # files look older than they are.
+        mark = source_mark(conn, db_path)
+        rows = conn.execute(
+            """
+            SELECT ZVALUESTRING, ZSTARTDATE + ?, ZENDDATE + ?
+            FROM ZOBJECT
+            WHERE ZSTREAMNAME LIKE '/app/usage%'
+              AND ZVALUESTRING IS NOT NULL
+              AND ZENDDATE > ZSTARTDATE
+            ORDER BY ZSTARTDATE
+            """,
+            (CORE_DATA_EPOCH, CORE_DATA_EPOCH),
+        )
+        added = convert_sessions(rows, root)
+    Path(root, SOURCE_MARK).write_text(json.dumps(mark))
+    return added
+
+class MonthColumns:
+    """A month partition mapped read-only; starts/durations/apps are memoryviews."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, n = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{path}: not a macwrap column file")
+        self.rows = n
+        view = memoryview(self._map)
+        offset = HEADER.size
+        self.starts = view[offset:offset + 8 * n].cast("q")
+        offset += 8 * n
+        self.durations = view[offset:offset + 4 * n].cast("i")
+        offset += 4 * n
+        self.apps = view[offset:offset + 2 * n].cast("H")
+        self._views = (view, self.starts, self.durations, self.apps)
+
+    def arrays(self):
+        # Zero-copy NumPy views over the same mapping.
+        return (
+            numpy.frombuffer(self.starts, dtype="<i8"),
+            numpy.frombuffer(self.durations, dtype="<i4"),
+            numpy.frombuffer(self.apps, dtype="<u2"),
+        )
+
+    def close(self):
+        # NumPy arrays from arrays() (or any other consumer still holding a
+        # buffer) pin their column view and the mapping; those are released
+        # and unmapped once the last holder is collected.
+        for view in self._views:
+            try:
+                view.release()
+            except BufferError:
+                pass
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def month_paths(year, root=None):
+    root = Path(root) if root else columns_dir()
+    return sorted(root.glob(f"{year}-[0-9][0-9].cols"))
+
+def app_totals(year, root=None):
+    """{bundle_id: (seconds, sessions)} for a year, straight off the columns."""
+    root = Path(root) if root else columns_dir()
+    names = load_dictionary(root)
+    seconds = [0] * len(names)
+    sessions = [0] * len(names)
+    for path in month_paths(year, root):
+        with MonthColumns(path) as month:
+            if numpy is not None:
+                starts, durations, apps = month.arrays()
+                seconds = numpy.bincount(apps, weights=durations, minlength=len(names)) + seconds
+                sessions = numpy.bincount(apps, minlength=len(names)) + sessions
+                del starts, durations, apps
+            else:
+                # Without NumPy this is one int per row; the mapping still
+                # spares the SQLite row tuples and the decoding behind them.
+                for code, duration in zip(month.apps, month.durations):
+                    seconds[code] += duration
+                    sessions[code] += 1
+    return {
+        name: (int(seconds[i]), int(sessions[i]))
+        for i, name in enumerate(names)
+        if sessions[i]
+    }
@@ -0,0 +1,94 @@
+import re
+
+# Token prefix trie over shell commands: "git commit -m x" counts towards
+# git -> commit. Nodes are [count, children] lists keyed by token so the whole
+# trie round-trips through JSON (the history index stores it).
+MAX_DEPTH = 3
+MAX_NODES = 2000
+
+SUBCOMMAND = re.compile(r"[a-z][a-z0-9_:-]*$")
+SKIP_PREFIXES = ("sudo", "time", "nohup", "command", "builtin", "exec", "noglob")
+
+def new_trie():
+    return {"size": 0, "root": {}}
+
+def tokenize(line):
+    tokens = line.split(None, 8)
+    # Drop env assignments and wrappers so "sudo FOO=1 brew install" is "brew install".
+    while tokens and ("=" in tokens[0] or tokens[0] in SKIP_PREFIXES):
+        tokens.pop(0)
+    if not tokens:
+        return ()
+    path = [tokens[0].rsplit("/", 1)[-1]]
+    for token in tokens[1:MAX_DEPTH]:
+        # Only word-like tokens are subcommands; flags and paths are arguments.
+        if not SUBCOMMAND.match(token):
+            break
+        path.append(token)
+    return path
+
+def add(trie, tokens, n=1):
+    children = trie["root"]
+    for token in tokens:
+        node = children.get(token)
+        if node is None:
+            node = children[token] = [0, {}]
+            trie["size"] += 1
+        node[0] += n
+        children = node[1]
+
+def add_lines(trie, counted_lines, max_nodes=MAX_NODES):
+    # counted_lines: (line, count) pairs, typically Counter.items() over raw
+    # history lines so identical commands are tokenized once.
+    for line, n in counted_lines:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8", "replace")
+        tokens = tokenize(line)
+        if tokens:
+            add(trie, tokens, n)
+    if trie["size"] > max_nodes:
+        prune(trie, max_nodes // 2)
+
+def _drop_below(children, floor):
+    removed = 0
+    for token in list(children):
+        count, grandchildren = children[token]
+        if count <= floor:
+            removed += 1 + _size(grandchildren)
+            del children[token]
+        else:
+            removed += _drop_below(grandchildren, floor)
+    return removed
+
+def _size(children):
+    return sum(1 + _size(node[1]) for node in children.values())
+
+def prune(trie, target):
+    # Raise the cut-off until the trie fits. A child never outcounts its
+    # parent, so dropping a node also drops only rarer descendants.
+    floor = 1
+    while trie["size"] > target and trie["root"]:
+        trie["size"] -= _drop_below(trie["root"], floor)
+        floor *= 2
+
+def merge(into, other, max_nodes=MAX_NODES):
+    def walk(children, path):
+        for token, (count, grandchildren) in children.items():
+            tokens = path + [token]
+            # Add only what isn't already accounted for by the descendants.
+            own = count - sum(node[0] for node in grandchildren.values())
+            if own:
+                add(into, tokens, own)
+            walk(grandchildren, tokens)
+    walk(other["root"], [])
+    if into["size"] > max_nodes:
+        prune(into, max_nodes // 2)
+    return into
+
+def top(trie, n=5, sub_n=3):
+    ranked = sorted(trie["root"].items(), key=lambda kv: kv[1][0], reverse=True)[:n]
+    result = []
+    for token, (count, children) in ranked:
+        subs = sorted(children.items(), key=lambda kv: kv[1][0], reverse=True)[:sub_n]
+        result.append((token, count, [(sub, node[0]) for sub, node in subs]))
+    return result
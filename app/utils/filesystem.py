@@ -1,30 +1,237 @@
+import marshal
+import math
+import os
+import re
+import shutil
+import signal
 import subprocess
-from collections import defaultdict
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from fnmatch import translate
 from pathlib import Path
+from app.utils.storage import data_dir
 
-def get_file_creation_stats(year=2025):
+# Seconds to let mdfind stream before we stop it and report what we have.
+MDFIND_DEADLINE = 5
+# Seconds the scandir fallback may walk before it stops scheduling new
+# directories and reports what it has counted.
+SCAN_DEADLINE = 20
+
+# Directory names the scandir backend never descends into.
+DEFAULT_EXCLUDES = (
+    ".git", "node_modules", "__pycache__", ".cache", "Caches", ".Trash",
+    ".venv", "venv", ".tox", ".npm", ".cargo", "Library", "DerivedData",
+)
+SCAN_WORKERS = 8
+INDEX_VERSION = 1
+
+def mdfind_query(year):
+    start = f"{year}-01-01"
+    end = f"{year+1}-01-01"
+    return f'kMDItemFSCreationDate >= $time.iso({start}) && kMDItemFSCreationDate < $time.iso({end})'
+
+def summarize(total, exts, sizes=None, truncated=False):
+    top = exts.most_common(5)
+    result = {"total": total, "top_types": top, "truncated": truncated}
+    if sizes is not None:
+        result["total_bytes"] = sum(sizes.values())
+        result["bytes_by_type"] = {ext: sizes[ext] for ext, _ in top}
+    return result
+
+def mdfind_file_creation_stats(year=2025, deadline=MDFIND_DEADLINE, mdfind="mdfind"):
+    # Stream mdfind's output line by line: a home directory with node_modules
+    # can match millions of paths, so nothing is buffered beyond one line and
+    # the extension counters. Hitting the deadline keeps the partial counts.
     try:
-        start = f"{year}-01-01"
-        end = f"{year+1}-01-01"
-
-        result = subprocess.run(
-            ['mdfind', f'kMDItemFSCreationDate >= $time.iso({start}) && kMDItemFSCreationDate < $time.iso({end})'],
-            capture_output=True,
-            text=True,
-            timeout=5
+        proc = subprocess.Popen(
+            [mdfind, mdfind_query(year)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=1 << 16,
+            start_new_session=True,
         )
+    except OSError:
+        return None
+
+    expired = threading.Event()
 
-        files = [f for f in result.stdout.split("\n") if f]
-        exts = defaultdict(int)
+    def stop():
+        expired.set()
+        # Kill the whole group in case mdfind (or a wrapper) forked helpers
+        # that still hold the pipe open.
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except OSError:
+            pass
 
-        for f in files:
-            ext = Path(f).suffix.lower()
+    timer = threading.Timer(deadline, stop)
+    timer.daemon = True
+    timer.start()
+    total = 0
+    exts = Counter()
+    try:
+        for line in proc.stdout:
+            path = line.rstrip(b"\n")
+            if not path:
+                continue
+            total += 1
+            ext = os.path.splitext(path)[1]
             if ext:
-                exts[ext] += 1
-
-        return {
-            "total": len(files),
-            "top_types": sorted(exts.items(), key=lambda x: x[1], reverse=True)[:5]
-        }
-    except:
-        return {"total": 0, "top_types": []}
+                exts[ext.lower().decode("utf-8", "replace")] += 1
+    finally:
+        timer.cancel()
+        proc.stdout.close()
+        proc.wait()
+    return summarize(total, exts, truncated=expired.is_set())
+
+def compile_excludes(excludes):
+    if not excludes:
+        return lambda name: False
+    return re.compile("|".join(translate(pattern) for pattern in excludes)).match
+
+def scan_dir(path, excluded):
+    """List one directory and bucket its files by creation year.
+
+    Returns ({year: [files, {ext: [files, bytes]}]}, subdirs). Creation time
+    is st_birthtime where the platform has it (macOS), otherwise st_ctime.
+    """
+    by_year, subdirs = {}, []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not excluded(entry.name):
+                            subdirs.append(entry.path)
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                born = getattr(st, "st_birthtime", None) or st.st_ctime
+                year = by_year.get(time.localtime(born).tm_year)
+                if year is None:
+                    year = by_year[time.localtime(born).tm_year] = [0, {}]
+                year[0] += 1
+                ext = os.path.splitext(entry.name)[1].lower()
+                if ext:
+                    counts = year[1].get(ext)
+                    if counts is None:
+                        counts = year[1][ext] = [0, 0]
+                    counts[0] += 1
+                    counts[1] += st.st_size
+    except OSError:
+        pass
+    return by_year, subdirs
+
+def visit_dir(path, excluded, cached):
+    # locate-style: a directory's mtime only changes when entries are added,
+    # removed or renamed in it, so an unchanged mtime means the cached listing
+    # (file counts and subdirectories) is still right. Subdirectories are still
+    # visited, but only stat()ed unless they changed too.
+    try:
+        mtime = os.lstat(path).st_mtime_ns
+    except OSError:
+        return None
+    if cached is not None and cached[0] == mtime:
+        return cached
+    by_year, subdirs = scan_dir(path, excluded)
+    return (mtime, subdirs, by_year)
+
+def file_index_path():
+    return data_dir() / "file_index.bin"
+
+def load_file_index(path, excludes):
+    # marshal is fast for big dicts of plain data but version-specific, so the
+    # header pins the interpreter version and the exclude list.
+    try:
+        with open(path, "rb") as f:
+            header, dirs = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return {}
+    if header != (INDEX_VERSION, tuple(sys.version_info[:2]), tuple(excludes)):
+        return {}
+    return dirs
+
+def save_file_index(path, excludes, dirs):
+    path = Path(path)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        marshal.dump(((INDEX_VERSION, tuple(sys.version_info[:2]), tuple(excludes)), dirs), f)
+    os.replace(tmp, path)
+
+def scan_file_creation_stats(year=2025, roots=None, excludes=DEFAULT_EXCLUDES, workers=SCAN_WORKERS, index_file=None, deadline=SCAN_DEADLINE):
+    # Walk the roots with a pool of directory workers: each task visits one
+    # directory and hands its subdirectories back to be scheduled. With an
+    # index file, unchanged directories are answered from the previous run.
+    # Past the deadline directories still queued are dropped, no new ones are
+    # scheduled and the result is marked truncated. Directories the walk didn't reach keep their records
+    # from the last index, both in the counts and in the saved index, so a
+    # tree too big for one deadline is covered over successive runs: the
+    # parts already indexed cost one lstat each next time.
+    roots = [os.path.abspath(r) for r in (roots or [Path.home()])]
+    excluded = compile_excludes(excludes)
+    index = load_file_index(index_file, excludes) if index_file else {}
+    visited = {}
+    stop_at = time.monotonic() + deadline
+    truncated = False
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(visit_dir, root, excluded, index.get(root)): root for root in roots}
+        while pending:
+            left = stop_at - time.monotonic()
+            timeout = max(left, 0) if math.isfinite(left) else None
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            expired = time.monotonic() >= stop_at
+            for future in done:
+                path = pending.pop(future)
+                record = future.result()
+                if record is None:
+                    continue
+                visited[path] = record
+                if expired:
+                    truncated |= bool(record[1])
+                    continue
+                for sub in record[1]:
+                    pending[pool.submit(visit_dir, sub, excluded, index.get(sub))] = sub
+            if expired:
+                # Only directories already being listed are waited for.
+                for future in [f for f in pending if f.cancel()]:
+                    del pending[future]
+                    truncated = True
+
+    if truncated:
+        visited = {**index, **visited}
+    if index_file and visited != index:
+        try:
+            save_file_index(index_file, excludes, visited)
+        except OSError:
+            pass
+
+    total = 0
+    counts, sizes = Counter(), Counter()
+    for _, _, by_year in visited.values():
+        found = by_year.get(year)
+        if found is None:
+            continue
+        total += found[0]
+        for ext, (n, size) in found[1].items():
+            counts[ext] += n
+            sizes[ext] += size
+    return summarize(total, counts, sizes, truncated)
+
+def get_file_creation_stats(year=2025, roots=None, excludes=DEFAULT_EXCLUDES):
+    # Spotlight is fastest when it's there and indexing; otherwise (indexing
+    # off, or not a Mac) walk the filesystem ourselves, reusing last run's
+    # directory index.
+    if shutil.which("mdfind"):
+        stats = mdfind_file_creation_stats(year)
+        if stats and (stats["total"] or stats["truncated"]):
+            return stats
+    try:
+        return scan_file_creation_stats(year, roots, excludes, index_file=file_index_path())
+    except Exception:
+        return {"total": 0, "top_types": [], "truncated": False}
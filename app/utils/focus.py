@@ -0,0 +1,66 @@
+from app.utils.screen_time import clean_app_name
+
+# Sessions of the same app less than FOCUS_GAP seconds apart belong to one
+# block, as long as other apps used less than FOCUS_GAP in between. A block
+# of FOCUS_MIN_HOURS or more counts as deep focus if the app itself filled
+# at least FOCUS_SHARE of it, so bouncing between two apps is never focus.
+FOCUS_GAP = 300
+FOCUS_MIN_HOURS = 2
+FOCUS_SHARE = 0.8
+
+class FocusBlocks:
+    """Merges each app's start-ordered sessions into gap-tolerant blocks.
+
+    One open block per app, extended or closed as that app's next session
+    arrives, so the sweep is O(n) over the stream with O(apps) state. Time
+    used by other apps since a block's last session is the running total of
+    all session time minus the total when that session was added.
+    """
+
+    def __init__(self, gap=FOCUS_GAP, min_hours=FOCUS_MIN_HOURS, share=FOCUS_SHARE):
+        self.gap = gap
+        self.min_seconds = min_hours * 3600
+        self.share = share
+        # app -> [start, end, own seconds, used total after its last session]
+        self.open = {}
+        self.used = 0.0
+        # app -> [blocks, seconds]
+        self.apps = {}
+
+    def add(self, app, start, end):
+        seconds = end - start
+        self.used += seconds
+        block = self.open.get(app)
+        if block is not None:
+            elsewhere = self.used - seconds - block[3]
+            if start - block[1] < self.gap and elsewhere < self.gap:
+                if end > block[1]:
+                    block[1] = end
+                block[2] += seconds
+                block[3] = self.used
+                return
+            self.close(app, block)
+        self.open[app] = [start, end, seconds, self.used]
+
+    def close(self, app, block):
+        seconds = block[1] - block[0]
+        if seconds >= self.min_seconds and block[2] >= self.share * seconds:
+            totals = self.apps.get(app)
+            if totals is None:
+                totals = self.apps[app] = [0, 0.0]
+            totals[0] += 1
+            totals[1] += seconds
+
+    def summary(self, top=3):
+        for app, block in self.open.items():
+            self.close(app, block)
+        self.open = {}
+        ranked = sorted(self.apps.items(), key=lambda kv: kv[1][1], reverse=True)
+        return {
+            "focus_sessions": sum(blocks for blocks, _ in self.apps.values()),
+            "focus_hours": int(sum(seconds for _, seconds in self.apps.values()) / 3600),
+            "top_focus_apps": [
+                (clean_app_name(app), round(seconds / 3600, 1), blocks)
+                for app, (blocks, seconds) in ranked[:top]
+            ],
+        }
@@ -0,0 +1,108 @@
+from array import array
+from app.utils.screen_time import clean_app_name
+
+# HDR-style log-linear buckets over whole seconds: exact below 2**SUB_BITS,
+# then every power of two is split into 2**SUB_BITS equal sub-buckets, so a
+# bucket is never wider than ~6% of the values in it. Everything from 1s to
+# MAX_SECONDS (~194 days) fits in a fixed array of a few hundred counters.
+SUB_BITS = 4
+SUB = 1 << SUB_BITS
+MAX_SECONDS = 1 << 24
+
+def bucket(seconds):
+    if seconds < SUB:
+        return seconds
+    shift = seconds.bit_length() - SUB_BITS - 1
+    return (shift + 1) * SUB + (seconds >> shift) - SUB
+
+def bucket_bounds(index):
+    # [low, high) seconds covered by a bucket.
+    if index < SUB:
+        return index, index + 1
+    shift = index // SUB - 1
+    low = (index % SUB + SUB) << shift
+    return low, low + (1 << shift)
+
+BUCKETS = bucket(MAX_SECONDS - 1) + 1
+
+class LogHistogram:
+    """Fixed-size session-length histogram; merges by adding counts."""
+
+    def __init__(self):
+        self.counts = array("Q", bytes(8 * BUCKETS))
+        self.total = 0
+
+    def add(self, seconds):
+        seconds = min(max(int(seconds), 0), MAX_SECONDS - 1)
+        self.counts[bucket(seconds)] += 1
+        self.total += 1
+
+    def percentile(self, q):
+        """Seconds at quantile q (0-1), as the midpoint of its bucket."""
+        if not self.total:
+            return 0
+        rank = max(1, round(q * self.total))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                low, high = bucket_bounds(index)
+                return (low + high - 1) / 2
+        return 0
+
+    def merge(self, other):
+        counts = self.counts
+        for index, n in enumerate(other.counts):
+            if n:
+                counts[index] += n
+        self.total += other.total
+        return self
+
+    def to_dict(self):
+        # Sparse and JSON-friendly; histograms from several machines or runs
+        # combine with merge() after from_dict().
+        return {
+            "sub_bits": SUB_BITS,
+            "counts": [[index, n] for index, n in enumerate(self.counts) if n],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get("sub_bits") != SUB_BITS:
+            raise ValueError("histogram was written with a different bucket layout")
+        histogram = cls()
+        for index, n in data["counts"]:
+            histogram.counts[index] += n
+            histogram.total += n
+        return histogram
+
+class SessionLengths:
+    """Per-app and overall session-length histograms, filled one session at a time."""
+
+    def __init__(self):
+        self.overall = LogHistogram()
+        self.apps = {}
+
+    def add(self, app, start, end):
+        seconds = end - start
+        if seconds <= 0:
+            return
+        histogram = self.apps.get(app)
+        if histogram is None:
+            histogram = self.apps[app] = LogHistogram()
+        histogram.add(seconds)
+        self.overall.add(seconds)
+
+    def summary(self, top=5):
+        overall = self.overall
+        busiest = sorted(self.apps.items(), key=lambda kv: kv[1].total, reverse=True)[:top]
+        return {
+            "sessions": overall.total,
+            "p50_seconds": overall.percentile(0.5),
+            "p90_seconds": overall.percentile(0.9),
+            "p99_seconds": overall.percentile(0.99),
+            # Median session of the apps opened most often.
+            "typical_by_app": [(clean_app_name(app), h.percentile(0.5)) for app, h in busiest],
+            # Kept with the stats so snapshots can be merged later.
+            "histogram": overall.to_dict(),
+        }
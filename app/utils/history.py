@@ -1,16 +1,316 @@
+import hashlib
+import json
+import mmap
+import os
+import re
+from collections import Counter
 from pathlib import Path
+from app.utils.localtime import LocalClock, QUARTER_HOUR
+from app.utils.storage import data_dir
+from app.utils import command_trie
 
-def get_command_history():
-    history_files = [
-        Path.home() / ".zsh_history",
-        Path.home() / ".bash_history",
-        Path.home() / ".history"
+# Upper bounds (seconds) of the command duration buckets; the last bucket
+# catches everything longer. Only zsh EXTENDED_HISTORY records durations.
+ELAPSED_BUCKETS = (1, 5, 30, 60, 300, 1800)
+ELAPSED_LABELS = ("<1s", "1-5s", "5-30s", "30s-1m", "1-5m", "5-30m", "30m+")
+
+ZSH_EXTENDED = re.compile(rb"^: (\d+):(\d+);([^\n]*)", re.M)
+BASH_TIMESTAMP = re.compile(rb"^#(\d{9,11})\r?\n([^\n]*)", re.M)
+FISH_ENTRY = re.compile(rb"^- cmd: ([^\n]*)\n(?:  when: (\d+))?", re.M)
+
+WINDOW = 16 << 20
+# Bytes sampled from each end of a file to detect its format.
+SAMPLE = 4096
+INDEX_VERSION = 3
+# Bytes just before a record's offset, hashed to spot in-place rewrites.
+FINGERPRINT_BYTES = 64
+
+def history_files():
+    home = Path.home()
+    files = []
+    if os.environ.get("HISTFILE"):
+        files.append(Path(os.environ["HISTFILE"]).expanduser())
+    files += [
+        home / ".zsh_history",
+        home / ".bash_history",
+        home / ".history",
+        home / ".local" / "share" / "fish" / "fish_history",
     ]
-    count = 0
-    for f in history_files:
-        if f.exists():
-            try:
-                count += sum(1 for _ in open(f, 'r', errors='ignore'))
-            except:
-                pass
-    return count
+    seen, unique = set(), []
+    for f in files:
+        key = os.path.realpath(f)
+        if key not in seen:
+            seen.add(key)
+            unique.append(f)
+    return unique
+
+def new_summary():
+    return {"years": {}, "undated": 0, "undated_commands": command_trie.new_trie()}
+
+def year_entry(summary, year):
+    entry = summary["years"].get(year)
+    if entry is None:
+        entry = summary["years"][year] = {
+            "count": 0,
+            "hours": [0] * 24,
+            "elapsed": [0] * (len(ELAPSED_BUCKETS) + 1),
+            "commands": command_trie.new_trie(),
+        }
+    return entry
+
+def elapsed_bucket(seconds):
+    for i, bound in enumerate(ELAPSED_BUCKETS):
+        if seconds < bound:
+            return i
+    return len(ELAPSED_BUCKETS)
+
+def detect_format(mm, path, end):
+    # Sample the tail as well as the head: timestamps are often switched on
+    # (setopt EXTENDED_HISTORY, HISTTIMEFORMAT) long after the file began.
+    if path.name == "fish_history" or mm[:7] == b"- cmd: ":
+        return "fish"
+    samples = (mm[:SAMPLE], mm[max(0, end - SAMPLE):end])
+    if any(ZSH_EXTENDED.search(sample) for sample in samples):
+        return "zsh"
+    if any(BASH_TIMESTAMP.search(sample) for sample in samples):
+        return "bash"
+    return "plain"
+
+def _clock():
+    # Commands cluster in time, so the local (year, hour) is resolved once
+    # per quarter hour instead of building a datetime for every entry.
+    return LocalClock(lambda t: (t.tm_year, t.tm_hour))
+
+def _windows(mm, start, end):
+    # Newline-aligned slices of about WINDOW bytes, so memory stays bounded.
+    pos = start
+    while pos < end:
+        stop = end if pos + WINDOW >= end else mm.rfind(b"\n", pos, pos + WINDOW) + 1
+        if stop <= pos:
+            stop = end
+        yield pos, stop
+        pos = stop
+
+def _fold_hours(summary, slots, clock):
+    for slot, n in Counter(slots).items():
+        year, hour = clock.quarter(slot)
+        entry = year_entry(summary, year)
+        entry["count"] += n
+        entry["hours"][hour] += n
+
+def _split_by_year(records, slots, clock):
+    # Yields (year, records) groups; the common case is a window inside one year.
+    first, last = clock.quarter(min(slots))[0], clock.quarter(max(slots))[0]
+    if first == last:
+        yield first, records
+        return
+    groups = {}
+    for record, slot in zip(records, slots):
+        groups.setdefault(clock.quarter(slot)[0], []).append(record)
+    yield from groups.items()
+
+def _plain_prefix(summary, mm, lo, hi, pattern):
+    # Lines written before timestamps were switched on are plain history;
+    # count them as undated and return where the timestamped records begin.
+    # Callers stop asking once a record is found, so continuation lines of
+    # a record split across windows are never taken for commands.
+    first = pattern.search(mm, lo, hi)
+    stop = first.start() if first else hi
+    if stop > lo:
+        _count_plain(summary, mm, lo, stop)
+    return stop, first is not None
+
+def _count_zsh(summary, mm, start, end, clock):
+    timestamped = False
+    for lo, hi in _windows(mm, start, end):
+        if not timestamped:
+            lo, timestamped = _plain_prefix(summary, mm, lo, hi, ZSH_EXTENDED)
+        records = ZSH_EXTENDED.findall(mm, lo, hi)
+        if not records:
+            continue
+        slots = [int(ts) // QUARTER_HOUR for ts, _, _ in records]
+        _fold_hours(summary, slots, clock)
+        for year, group in _split_by_year(records, slots, clock):
+            entry = year_entry(summary, year)
+            # Bucket by distinct duration / command line, not per record.
+            for seconds, n in Counter(e for _, e, _ in group).items():
+                entry["elapsed"][elapsed_bucket(int(seconds))] += n
+            command_trie.add_lines(entry["commands"], Counter(cmd for _, _, cmd in group).items())
+
+def _count_bash(summary, mm, start, end, clock):
+    timestamped = False
+    for lo, hi in _windows(mm, start, end):
+        if not timestamped:
+            lo, timestamped = _plain_prefix(summary, mm, lo, hi, BASH_TIMESTAMP)
+        records = BASH_TIMESTAMP.findall(mm, lo, hi)
+        if not records:
+            continue
+        slots = [int(ts) // QUARTER_HOUR for ts, _ in records]
+        _fold_hours(summary, slots, clock)
+        for year, group in _split_by_year(records, slots, clock):
+            command_trie.add_lines(year_entry(summary, year)["commands"], Counter(cmd for _, cmd in group).items())
+
+def _count_fish(summary, mm, start, end, clock):
+    for lo, hi in _windows(mm, start, end):
+        records = FISH_ENTRY.findall(mm, lo, hi)
+        dated = [r for r in records if r[1]]
+        undated = [cmd for cmd, ts in records if not ts]
+        summary["undated"] += len(undated)
+        command_trie.add_lines(summary["undated_commands"], Counter(undated).items())
+        if not dated:
+            continue
+        slots = [int(ts) // QUARTER_HOUR for _, ts in dated]
+        _fold_hours(summary, slots, clock)
+        for year, group in _split_by_year(dated, slots, clock):
+            command_trie.add_lines(year_entry(summary, year)["commands"], Counter(cmd for cmd, _ in group).items())
+
+def _count_plain(summary, mm, start, end):
+    # One command per line, except zsh/bash continuation lines ending in "\".
+    for lo, hi in _windows(mm, start, end):
+        lines = mm[lo:hi].split(b"\n")[:-1]
+        commands = Counter()
+        continued = False
+        for line in lines:
+            if not continued:
+                commands[line] += 1
+            continued = line.endswith(b"\\")
+        summary["undated"] += sum(commands.values())
+        command_trie.add_lines(summary["undated_commands"], commands.items())
+
+def parse_history_file(path, summary=None, start=0):
+    """Fold the records of one history file into `summary`.
+
+    Parsing starts at byte `start` and stops at the last complete line.
+    Returns the summary and the offset parsing stopped at.
+    """
+    summary = new_summary() if summary is None else summary
+    path = Path(path)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= start:
+            return summary, start
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = mm.rfind(b"\n", start) + 1
+            if end <= start:
+                return summary, start
+            fmt = detect_format(mm, path, end)
+            clock = _clock()
+            if fmt == "zsh":
+                _count_zsh(summary, mm, start, end, clock)
+            elif fmt == "bash":
+                _count_bash(summary, mm, start, end, clock)
+            elif fmt == "fish":
+                _count_fish(summary, mm, start, end, clock)
+            else:
+                _count_plain(summary, mm, start, end)
+    return summary, end
+
+def merge_summary(into, other):
+    into["undated"] += other["undated"]
+    command_trie.merge(into["undated_commands"], other["undated_commands"])
+    for year, entry in other["years"].items():
+        target = year_entry(into, year)
+        target["count"] += entry["count"]
+        target["hours"] = [a + b for a, b in zip(target["hours"], entry["hours"])]
+        target["elapsed"] = [a + b for a, b in zip(target["elapsed"], entry["elapsed"])]
+        command_trie.merge(target["commands"], entry["commands"])
+    return into
+
+def index_path():
+    return data_dir() / "history_index.json"
+
+def load_index(path):
+    try:
+        index = json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return {}
+    if index.get("version") != INDEX_VERSION:
+        return {}
+    files = index.get("files", {})
+    for record in files.values():
+        # JSON object keys are strings; years are ints everywhere else.
+        record["summary"]["years"] = {int(y): e for y, e in record["summary"]["years"].items()}
+    return files
+
+def save_index(path, files):
+    path = Path(path)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"version": INDEX_VERSION, "files": files}))
+    os.replace(tmp, path)
+
+def fingerprint(f, offset):
+    with open(f, "rb") as fh:
+        fh.seek(max(0, offset - FINGERPRINT_BYTES))
+        data = fh.read(min(offset, FINGERPRINT_BYTES))
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+def update_record(f, record):
+    """Bring one file's index record up to date, parsing only appended bytes.
+
+    History files only grow, so a record is resumed from its last offset as
+    long as the inode is unchanged, the file hasn't shrunk and the bytes
+    just before the offset still hash to the stored fingerprint. Anything
+    else (rotation, zsh or `history -w` rewriting the file in place) means
+    a full rescan.
+    """
+    st = os.stat(f)
+    if (
+        record is None
+        or record["inode"] != st.st_ino
+        or st.st_size < record["offset"]
+        or fingerprint(f, record["offset"]) != record["fingerprint"]
+    ):
+        record = {"inode": st.st_ino, "offset": 0, "summary": new_summary(), "fingerprint": fingerprint(f, 0)}
+    if st.st_size > record["offset"]:
+        _, offset = parse_history_file(f, record["summary"], record["offset"])
+        if offset != record["offset"]:
+            record["offset"], record["fingerprint"] = offset, fingerprint(f, offset)
+    record["size"] = st.st_size
+    return record
+
+def collect_history(files=None, index_file=None):
+    index_file = index_path() if index_file is None else index_file
+    index = load_index(index_file)
+    updated = {}
+    changed = False
+    summary = new_summary()
+    for f in files or history_files():
+        if not f.exists():
+            continue
+        key = str(f)
+        before = index.get(key)
+        before = before and (before["inode"], before["offset"], before["size"], before["fingerprint"])
+        try:
+            record = updated[key] = update_record(f, index.get(key))
+        except (OSError, ValueError):
+            continue
+        changed |= before != (record["inode"], record["offset"], record["size"], record["fingerprint"])
+        merge_summary(summary, record["summary"])
+    if changed or updated.keys() != index.keys():
+        try:
+            save_index(index_file, updated)
+        except OSError:
+            pass
+    return summary
+
+def command_stats(summary, year):
+    # Undated entries (plain history files) can't be placed in a year; they
+    # are credited to the wrap year since that's the best guess we have.
+    entry = summary["years"].get(year) or year_entry(new_summary(), year)
+    commands = command_trie.merge(command_trie.new_trie(), entry["commands"])
+    command_trie.merge(commands, summary["undated_commands"])
+    return {
+        "count": entry["count"] + summary["undated"],
+        "dated": entry["count"],
+        "undated": summary["undated"],
+        "per_year": {y: e["count"] for y, e in sorted(summary["years"].items())},
+        "hourly": list(entry["hours"]),
+        "elapsed": dict(zip(ELAPSED_LABELS, entry["elapsed"])),
+        "top_commands": command_trie.top(commands),
+    }
+
+def get_command_stats(year=2025):
+    return command_stats(collect_history(), year)
+
+def get_command_history(year=2025):
+    return get_command_stats(year)["count"]
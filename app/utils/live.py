@@ -0,0 +1,129 @@
+import sqlite3
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+from app.utils.screen_time import CORE_DATA_EPOCH
+from app.utils.session_store import read_only_uri
+
+def open_live_db(db_path):
+    # A long-lived read-only connection on the real file: PRAGMA data_version
+    # only moves for commits made by *other* connections, which is exactly
+    # what we want to notice. A temp copy would never change.
+    if not Path(db_path).exists():
+        # SQLite would only say "unable to open database file".
+        raise FileNotFoundError(f"no such database: {db_path}")
+    conn = sqlite3.connect(read_only_uri(db_path), uri=True)
+    conn.execute("SELECT 1 FROM ZOBJECT LIMIT 1")
+    return conn
+
+class LiveUsage:
+    """Today's and this week's usage, kept current by folding in new rows.
+
+    The first refresh reads this week's sessions once; after that a refresh
+    is a PRAGMA data_version check, and only when it moved a Z_PK range scan
+    for the rows added since. Days are local time, Monday first.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.version = None
+        self.mark = 0
+        self.week = None
+        self.today = None
+        # date -> [seconds, Counter(app -> seconds), [seconds per start hour]]
+        self.days = {}
+
+    def changed(self):
+        version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        if version == self.version:
+            return False
+        self.version = version
+        return True
+
+    def refresh(self, now=None):
+        """Fold in anything new; True if the dashboard should be redrawn."""
+        today = (now or datetime.now()).date()
+        week = today - timedelta(days=today.weekday())
+        # Crossing midnight redraws even if nothing was written.
+        redraw = today != self.today
+        self.today = today
+        if week != self.week:
+            first = self.week is None
+            self.week = week
+            self.days = {day: data for day, data in self.days.items() if day >= week}
+            if first:
+                self.changed()
+                self.load(week)
+                return True
+        if self.changed():
+            redraw = self.fold_new_rows() or redraw
+        return redraw
+
+    def load(self, week):
+        since = datetime.combine(week, datetime.min.time()).timestamp() - CORE_DATA_EPOCH
+        self.mark = self.conn.execute("SELECT MAX(Z_PK) FROM ZOBJECT").fetchone()[0] or 0
+        self.fold(self.conn.execute(
+            """
+            SELECT ZVALUESTRING, ZSTARTDATE + ?, ZENDDATE + ?
+            FROM ZOBJECT
+            WHERE ZSTARTDATE >= ? AND Z_PK <= ?
+              AND ZSTREAMNAME LIKE '/app/usage%'
+              AND ZVALUESTRING IS NOT NULL
+              AND ZENDDATE > ZSTARTDATE
+            """,
+            (CORE_DATA_EPOCH, CORE_DATA_EPOCH, since, self.mark),
+        ))
+
+    def fold_new_rows(self):
+        newest = self.conn.execute("SELECT MAX(Z_PK) FROM ZOBJECT").fetchone()[0] or 0
+        if newest <= self.mark:
+            return False
+        folded = self.fold(self.conn.execute(
+            """
+            SELECT ZVALUESTRING, ZSTARTDATE + ?, ZENDDATE + ?
+            FROM ZOBJECT
+            WHERE Z_PK > ? AND Z_PK <= ?
+              AND ZSTREAMNAME LIKE '/app/usage%'
+              AND ZVALUESTRING IS NOT NULL
+              AND ZENDDATE > ZSTARTDATE
+            """,
+            (CORE_DATA_EPOCH, CORE_DATA_EPOCH, self.mark, newest),
+        ))
+        self.mark = newest
+        return folded > 0
+
+    def fold(self, rows):
+        folded = 0
+        for app, start, end in rows:
+            started = datetime.fromtimestamp(start)
+            day = started.date()
+            if day < self.week:
+                continue
+            data = self.days.get(day)
+            if data is None:
+                data = self.days[day] = [0.0, Counter(), [0.0] * 24]
+            seconds = end - start
+            data[0] += seconds
+            data[1][app] += seconds
+            data[2][started.hour] += seconds
+            folded += 1
+        return folded
+
+    def snapshot(self, now=None, top=5):
+        today = (now or datetime.now()).date()
+        empty = [0.0, Counter(), [0.0] * 24]
+        current = self.days.get(today, empty)
+        week_apps = Counter()
+        week_seconds = 0.0
+        for day, data in self.days.items():
+            if day <= today:
+                week_seconds += data[0]
+                week_apps.update(data[1])
+        return {
+            "date": today,
+            "today_hours": current[0] / 3600,
+            "week_hours": week_seconds / 3600,
+            "top_today": [(app, s / 3600) for app, s in current[1].most_common(top)],
+            "top_week": [(app, s / 3600) for app, s in week_apps.most_common(top)],
+            "hourly": [s / 3600 for s in current[2]],
+        }
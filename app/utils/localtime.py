@@ -0,0 +1,27 @@
+import time
+
+# Every UTC offset in use is a whole number of quarter hours (+05:30, +05:45,
+# +08:45, ...), so all timestamps in one quarter hour share their local date
+# and hour. Aggregates convert each quarter hour once instead of every row.
+QUARTER_HOUR = 900
+
+class LocalClock:
+    """Caches fields(time.localtime(...)) per quarter hour.
+
+    `fields` turns a struct_time into whatever the caller groups by, so the
+    formatting is cached along with the conversion.
+    """
+
+    def __init__(self, fields):
+        self.fields = fields
+        self.cache = {}
+
+    def quarter(self, quarter):
+        # For callers that already bucket timestamps by seconds // QUARTER_HOUR.
+        found = self.cache.get(quarter)
+        if found is None:
+            found = self.cache[quarter] = self.fields(time.localtime(quarter * QUARTER_HOUR))
+        return found
+
+    def __call__(self, seconds):
+        return self.quarter(int(seconds) // QUARTER_HOUR)
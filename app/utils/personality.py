@@ -1,36 +1,115 @@
-def generate_personality(top_apps, total_hours, peak_hour, late_night_hours, focus_hours):
-    if not top_apps or total_hours == 0:
-        return "Digital Minimalist"
-
-    top_app = top_apps[0][0].lower() if top_apps else ""
-
-    personalities = {
-        "chrome": "Professional Tab Hoarder",
-        "safari": "Apple Ecosystem Devotee",
-        "firefox": "Privacy-Conscious Browser",
-        "vscode": "Code Wizard",
-        "xcode": "Apple Developer",
-        "terminal": "Command Line Warrior",
-        "spotify": "Music-Powered Worker",
-        "photoshop": "Creative Visionary",
-        "figma": "Design Perfectionist",
-        "notion": "Organization Guru",
+import operator
+import re
+
+# App keyword -> (persona, weight). Every top app votes for the first keyword
+# its name contains, with its hours times the weight; the heaviest persona wins.
+APP_RULES = [
+    ("chrome", "Professional Tab Hoarder", 1.0),
+    ("safari", "Apple Ecosystem Devotee", 1.0),
+    ("firefox", "Privacy-Conscious Browser", 1.0),
+    ("vscode", "Code Wizard", 1.2),
+    ("xcode", "Apple Developer", 1.2),
+    ("terminal", "Command Line Warrior", 1.2),
+    ("iterm", "Command Line Warrior", 1.2),
+    ("spotify", "Music-Powered Worker", 0.5),
+    ("photoshop", "Creative Visionary", 1.0),
+    ("figma", "Design Perfectionist", 1.0),
+    ("notion", "Organization Guru", 1.0),
+]
+DEFAULT_PERSONA = "Digital Professional"
+
+# Prefix groups, applied in order; within a group the first rule whose
+# conditions all hold adds its prefix. Conditions are (feature, op, value).
+MODIFIER_RULES = [
+    [
+        ("Deep Focus", [("focus_hours", ">", 500)]),
+        ("Hardcore", [("total_hours", ">", 2000)]),
+    ],
+    [
+        ("Night Owl", [("late_night_share", ">", 0.3)]),
+        ("Early Bird", [("peak_hour", ">=", 5), ("peak_hour", "<=", 8)]),
+    ],
+]
+OPERATORS = {">": operator.gt, ">=": operator.ge, "<": operator.lt, "<=": operator.le}
+
+def features(record):
+    total = record.get("total_hours", 0) or 0
+    late = record.get("late_night_hours", 0) or 0
+    return {
+        "total_hours": total,
+        "focus_hours": record.get("focus_hours", 0) or 0,
+        "late_night_share": late / total if total else 0,
+        "peak_hour": record.get("peak_hour", 12),
     }
 
-    personality = "Digital Professional"
-    for key, value in personalities.items():
-        if key in top_app:
-            personality = value
-            break
+class PersonalityMatcher:
+    """APP_RULES and MODIFIER_RULES compiled once for classifying many records."""
+
+    def __init__(self, app_rules=APP_RULES, modifier_rules=MODIFIER_RULES, default=DEFAULT_PERSONA):
+        self.default = default
+        # Longer keywords first so "xcode" isn't claimed by "code".
+        ordered = sorted(app_rules, key=lambda rule: -len(rule[0]))
+        self.keyword_re = re.compile("|".join(re.escape(k) for k, _, _ in ordered))
+        self.by_keyword = {k: (persona, weight) for k, persona, weight in app_rules}
+        self.modifier_rules = [
+            [(prefix, [(feature, OPERATORS[op], value) for feature, op, value in conditions])
+             for prefix, conditions in group]
+            for group in modifier_rules
+        ]
+        # App names repeat heavily across a fleet; resolve each one once.
+        self.app_cache = {}
+
+    def app_vote(self, app_name):
+        vote = self.app_cache.get(app_name)
+        if vote is None:
+            m = self.keyword_re.search(app_name.lower())
+            vote = self.app_cache[app_name] = self.by_keyword[m.group(0)] if m else ()
+        return vote
 
-    if focus_hours > 500:
-        personality = f"Deep Focus {personality}"
-    elif total_hours > 2000:
-        personality = f"Hardcore {personality}"
+    def persona(self, top_apps):
+        scores = {}
+        for app in top_apps:
+            vote = self.app_vote(app[0])
+            if vote:
+                persona, weight = vote
+                scores[persona] = scores.get(persona, 0) + (app[1] or 0) * weight
+        if not scores:
+            return self.default
+        return max(scores.items(), key=lambda kv: kv[1])[0]
 
-    if total_hours and late_night_hours > total_hours * 0.3:
-        personality = f"Night Owl {personality}"
-    elif 5 <= peak_hour <= 8:
-        personality = f"Early Bird {personality}"
+    def classify(self, record):
+        top_apps = record.get("top_apps") or []
+        if not top_apps or not record.get("total_hours"):
+            return "Digital Minimalist"
+        personality = self.persona(top_apps)
+        values = features(record)
+        for group in self.modifier_rules:
+            for prefix, conditions in group:
+                if all(op(values[feature], value) for feature, op, value in conditions):
+                    personality = f"{prefix} {personality}"
+                    break
+        return personality
 
-    return personality
+    def classify_batch(self, records):
+        classify = self.classify
+        return [classify(record) for record in records]
+
+_matcher = None
+
+def default_matcher():
+    global _matcher
+    if _matcher is None:
+        _matcher = PersonalityMatcher()
+    return _matcher
+
+def classify_batch(records):
+    return default_matcher().classify_batch(records)
+
+def generate_personality(top_apps, total_hours, peak_hour, late_night_hours, focus_hours):
+    return default_matcher().classify({
+        "top_apps": top_apps,
+        "total_hours": total_hours,
+        "peak_hour": peak_hour,
+        "late_night_hours": late_night_hours,
+        "focus_hours": focus_hours,
+    })
@@ -1,11 +1,154 @@
+import re
 import subprocess
+import threading
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+
+# pmset -g log can be hundreds of MB; stop streaming after this many seconds.
+PMSET_DEADLINE = 10
+
+PowerEvent = namedtuple("PowerEvent", "kind timestamp reason duration")
+
+# "2025-01-06 09:12:33 +0100 Sleep               \tEntering Sleep state due to ... \t1763 secs"
+LINE = re.compile(
+    r"^(\d{4})-(\d\d)-(\d\d) (\d\d):(\d\d):(\d\d) ([+-])(\d\d)(\d\d) "
+    r"(Sleep|Wake|DarkWake|Shutdown Cause|Restart|Shutdown)\s*\t(.*)$"
+)
+DURATION = re.compile(r"\t\s*(\d+) secs\s*$")
+REASON = re.compile(r"due to (?:'([^']*)'|(\S+))")
+SOURCE = re.compile(r"Using (AC|Batt|BATT)")
+CAUSE = re.compile(r"Shutdown Cause\s*[:=]\s*(-?\d+)")
+
+KINDS = {
+    "Sleep": "sleep",
+    "Wake": "wake",
+    "DarkWake": "dark_wake",
+    # Logged once at every boot, naming why the previous session ended.
+    "Shutdown Cause": "boot",
+    "Shutdown": "shutdown",
+    "Restart": "restart",
+}
+
+# Upper bounds (minutes) of the sleep duration buckets; last one is open-ended.
+SLEEP_BUCKETS = (5, 30, 120, 480)
+SLEEP_LABELS = ("<5m", "5-30m", "30m-2h", "2-8h", "8h+")
+
+_zones = {}
+
+def _zone(sign, hh, mm):
+    key = (sign, hh, mm)
+    tz = _zones.get(key)
+    if tz is None:
+        offset = timedelta(hours=int(hh), minutes=int(mm))
+        tz = _zones[key] = timezone(-offset if sign == "-" else offset)
+    return tz
+
+def parse_pmset_lines(lines, year=None):
+    """Turn pmset log lines into PowerEvents, in log order.
+
+    Besides the logged kinds (sleep, wake, dark_wake, shutdown, restart, and
+    boot for the Shutdown Cause line every boot writes), a "power_source"
+    event is emitted whenever the "Using AC/Batt" note flips.
+    """
+    prefix = f"{year}-" if year else ""
+    source = None
+    for line in lines:
+        if not line.startswith(prefix):
+            continue
+        m = LINE.match(line)
+        if m is None:
+            continue
+        y, mo, d, h, mi, s, sign, oh, om, kind, message = m.groups()
+        ts = datetime(int(y), int(mo), int(d), int(h), int(mi), int(s), tzinfo=_zone(sign, oh, om))
+        kind = KINDS[kind]
+        found = DURATION.search(message)
+        duration = int(found.group(1)) if found else None
+        if kind == "boot":
+            found = CAUSE.search(message)
+            reason = found.group(1) if found else None
+        else:
+            found = REASON.search(message)
+            reason = (found.group(1) or found.group(2)) if found else None
+        yield PowerEvent(kind, ts, reason, duration)
+
+        found = SOURCE.search(message)
+        if found:
+            current = "AC" if found.group(1) == "AC" else "Battery"
+            if source is not None and current != source:
+                yield PowerEvent("power_source", ts, current, None)
+            source = current
+
+def stream_pmset_log(deadline=PMSET_DEADLINE):
+    # Line-by-line from the pmset process; stopping early (or the deadline)
+    # kills it instead of waiting for the whole log.
+    proc = subprocess.Popen(
+        ["pmset", "-g", "log"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        errors="replace",
+    )
+    timer = threading.Timer(deadline, proc.kill)
+    timer.daemon = True
+    timer.start()
+    try:
+        yield from proc.stdout
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            proc.kill()
+        proc.stdout.close()
+        proc.wait()
+
+def sleep_bucket(minutes):
+    for i, bound in enumerate(SLEEP_BUCKETS):
+        if minutes < bound:
+            return i
+    return len(SLEEP_BUCKETS)
+
+def new_power_tally():
+    return {
+        "counts": dict.fromkeys(("sleep", "wake", "dark_wake", "shutdown", "restart", "boot", "power_source"), 0),
+        "buckets": [0] * (len(SLEEP_BUCKETS) + 1),
+        "durations": [],
+    }
+
+def tally_power_event(tally, event):
+    tally["counts"][event.kind] += 1
+    if event.kind == "sleep" and event.duration:
+        tally["buckets"][sleep_bucket(event.duration / 60)] += 1
+        tally["durations"].append(event.duration)
+
+def tallied(events, tally):
+    # Count events as they stream past, so one pmset pass can feed both the
+    # summary and another consumer (see app.utils.timeline).
+    for event in events:
+        tally_power_event(tally, event)
+        yield event
+
+def power_summary(tally):
+    counts = tally["counts"]
+    durations = sorted(tally["durations"])
+    return {
+        "sleeps": counts["sleep"],
+        "wakes": counts["wake"],
+        "dark_wakes": counts["dark_wake"],
+        # Shutdown and Restart lines are only logged for clean ones, and a
+        # restart logs both; the boot's Shutdown Cause is there every time.
+        "reboots": counts["boot"],
+        "power_source_changes": counts["power_source"],
+        "sleep_durations": dict(zip(SLEEP_LABELS, tally["buckets"])),
+        "median_sleep_minutes": round(durations[len(durations) // 2] / 60, 1) if durations else 0,
+    }
+
+def summarize_power_events(events):
+    tally = new_power_tally()
+    for event in events:
+        tally_power_event(tally, event)
+    return power_summary(tally)
 
 def get_power_events(year=2025):
     try:
-        log = subprocess.run(['pmset', '-g', 'log'], capture_output=True, text=True, timeout=3)
-        lines = log.stdout.split('\n')
-        sleeps = sum(1 for l in lines if "Sleep" in l and str(year) in l)
-        wakes  = sum(1 for l in lines if "Wake" in l and str(year) in l)
-        return {"sleeps": sleeps, "wakes": wakes, "reboots": sleeps // 10}
-    except:
+        return summarize_power_events(parse_pmset_lines(stream_pmset_log(), year))
+    except Exception:
         return {"sleeps": 0, "wakes": 0, "reboots": 0}
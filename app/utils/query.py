@@ -0,0 +1,241 @@
+import csv
+import json
+import re
+import time
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+from fnmatch import fnmatchcase
+from pathlib import Path
+from app.utils.localtime import LocalClock
+from app.utils.screen_time import CORE_DATA_EPOCH
+
+# A small query language over usage sessions, e.g.
+#
+#   by app, weekday app *chrome* from 2025-01-01 to 2025-03-31 order hours desc limit 10
+#
+#   by KEY[, KEY...]     group by app, day, hour and/or weekday (none: one total row)
+#   app PATTERN          bundle ID glob, case-insensitive; no wildcard means "contains"
+#   from DATE / to DATE  inclusive YYYY-MM-DD bounds on the session start
+#   order FIELD [asc|desc]  FIELD is a group key, hours or sessions
+#   limit N
+#
+# Every row carries hours and sessions. Days and hours are local time.
+KEYS = ("app", "day", "hour", "weekday")
+FIELDS = KEYS + ("hours", "sessions")
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+Query = namedtuple("Query", "keys app since until order desc limit")
+
+class QueryError(ValueError):
+    pass
+
+TOKEN = re.compile(r"\s*(,|[^\s,]+)")
+
+def tokenize(text):
+    return TOKEN.findall(text)
+
+def parse_date(token):
+    try:
+        return date.fromisoformat(token)
+    except ValueError:
+        raise QueryError(f"expected a YYYY-MM-DD date, got {token!r}") from None
+
+def parse_query(text):
+    tokens = tokenize(text)
+    keys, app, since, until, order, desc, limit = [], None, None, None, None, None, None
+
+    def take(what):
+        if not tokens:
+            raise QueryError(f"expected {what} at end of query")
+        return tokens.pop(0)
+
+    while tokens:
+        word = tokens.pop(0).lower()
+        if word == "by":
+            while True:
+                key = take("a group key").lower()
+                if key not in KEYS:
+                    raise QueryError(f"can't group by {key!r}; use one of {', '.join(KEYS)}")
+                if key not in keys:
+                    keys.append(key)
+                if not tokens or tokens[0] != ",":
+                    break
+                tokens.pop(0)
+        elif word == "app":
+            app = take("an app pattern")
+        elif word == "from":
+            since = parse_date(take("a date"))
+        elif word == "to":
+            until = parse_date(take("a date"))
+        elif word == "order":
+            if tokens and tokens[0].lower() == "by":
+                tokens.pop(0)
+            order = take("a field to order by").lower()
+            if order not in FIELDS:
+                raise QueryError(f"can't order by {order!r}; use one of {', '.join(FIELDS)}")
+            if tokens and tokens[0].lower() in ("asc", "desc"):
+                desc = tokens.pop(0).lower() == "desc"
+        elif word == "limit":
+            value = take("a number")
+            if not value.isdigit():
+                raise QueryError(f"limit needs a number, got {value!r}")
+            limit = int(value)
+        else:
+            raise QueryError(f"unexpected {word!r}")
+
+    if order in KEYS and order not in keys:
+        raise QueryError(f"can't order by {order!r} without grouping by it")
+    if order is None:
+        # Time groupings read best in time order, everything else biggest first.
+        order = keys[0] if keys and keys[0] != "app" else "hours"
+    if desc is None:
+        desc = order in ("hours", "sessions")
+    return Query(tuple(keys), app, since, until, order, desc, limit)
+
+def header(query):
+    return [*query.keys, "hours", "sessions"]
+
+def app_glob(pattern):
+    pattern = pattern.lower()
+    return pattern if any(c in pattern for c in "*?[") else f"*{pattern}*"
+
+def local_bound(day):
+    # Unix seconds of local midnight starting `day`.
+    return datetime.combine(day, datetime.min.time()).timestamp()
+
+# ---------------------------------------------------------------- SQLite
+
+LOCAL_START = f"ZSTARTDATE + {CORE_DATA_EPOCH}, 'unixepoch', 'localtime'"
+SQL_KEYS = {
+    "app": "ZVALUESTRING",
+    "day": f"date({LOCAL_START})",
+    "hour": f"CAST(strftime('%H', {LOCAL_START}) AS INTEGER)",
+    "weekday": f"substr('MonTueWedThuFriSatSun', 1 + 3 * ((strftime('%w', {LOCAL_START}) + 6) % 7), 3)",
+}
+# Weekday names would sort alphabetically; order them Monday first.
+SQL_ORDER = {**SQL_KEYS, "weekday": f"(strftime('%w', {LOCAL_START}) + 6) % 7", "hours": "hours", "sessions": "sessions"}
+
+def glob_to_like(pattern):
+    escaped = pattern.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return escaped.replace("*", "%").replace("?", "_")
+
+def compile_sql(query):
+    """One pushed-down aggregate query for `query`: (sql, params)."""
+    where = [
+        "ZSTREAMNAME LIKE '/app/usage%'",
+        "ZVALUESTRING IS NOT NULL",
+        "ZENDDATE > ZSTARTDATE",
+    ]
+    params = []
+    if query.app:
+        where.append("ZVALUESTRING LIKE ? ESCAPE '\\'")
+        params.append(glob_to_like(app_glob(query.app)))
+    # Bounds on the raw column so SQLite can use its ZSTARTDATE index.
+    if query.since:
+        where.append("ZSTARTDATE >= ?")
+        params.append(local_bound(query.since) - CORE_DATA_EPOCH)
+    if query.until:
+        where.append("ZSTARTDATE < ?")
+        params.append(local_bound(query.until + timedelta(days=1)) - CORE_DATA_EPOCH)
+    select = [f"{SQL_KEYS[k]} AS {k}" for k in query.keys]
+    sql = (
+        f"SELECT {', '.join(select + ['ROUND(SUM(ZENDDATE - ZSTARTDATE) / 3600.0, 2) AS hours', 'COUNT(*) AS sessions'])}\n"
+        f"FROM ZOBJECT\nWHERE {' AND '.join(where)}"
+    )
+    if query.keys:
+        sql += f"\nGROUP BY {', '.join(SQL_KEYS[k] for k in query.keys)}"
+    # Ties fall back to the group keys, in order.
+    order = [f"{SQL_ORDER[query.order]} {'DESC' if query.desc else 'ASC'}"]
+    order += [SQL_ORDER[k] for k in query.keys if k != query.order]
+    sql += f"\nORDER BY {', '.join(order)}"
+    if query.limit is not None:
+        sql += "\nLIMIT ?"
+        params.append(query.limit)
+    return sql, params
+
+def sql_rows(conn, query):
+    sql, params = compile_sql(query)
+    # Rows come off the cursor one at a time. A for loop rather than yield
+    # from: closing the generator after the connection (a reader that quit
+    # early) must not forward close() to the dead cursor.
+    for row in conn.execute(sql, params):
+        yield row
+
+# --------------------------------------------------------------- columns
+
+def column_rows(root, query):
+    """The same query as a scan over the columnar month files (see app.utils.columnar)."""
+    from app.utils.columnar import load_dictionary, MonthColumns
+
+    root = Path(root)
+    names = load_dictionary(root)
+    # The app filter is resolved against the dictionary once, not per row.
+    pattern = app_glob(query.app) if query.app else None
+    wanted = [pattern is None or fnmatchcase(name.lower(), pattern) for name in names]
+    since = local_bound(query.since) if query.since else None
+    until = local_bound(query.until + timedelta(days=1)) if query.until else None
+    first = time.strftime("%Y-%m", time.gmtime(since)) if since else ""
+    last = time.strftime("%Y-%m", time.gmtime(until)) if until else "9999-99"
+
+    keys = query.keys
+    groups = {}
+    local = LocalClock(lambda t: {
+        "day": f"{t.tm_year}-{t.tm_mon:02d}-{t.tm_mday:02d}",
+        "hour": t.tm_hour,
+        "weekday": WEEKDAYS[t.tm_wday],
+    })
+    for path in sorted(root.glob("[0-9][0-9][0-9][0-9]-[0-9][0-9].cols")):
+        if not first <= path.stem <= last:
+            continue
+        with MonthColumns(path) as month:
+            for start, duration, code in zip(month.starts, month.durations, month.apps):
+                if not wanted[code]:
+                    continue
+                if since is not None and start < since or until is not None and start >= until:
+                    continue
+                parts = local(start)
+                group = tuple(names[code] if k == "app" else parts[k] for k in keys)
+                totals = groups.get(group)
+                if totals is None:
+                    totals = groups[group] = [0, 0]
+                totals[0] += duration
+                totals[1] += 1
+
+    rows = [(*group, round(seconds / 3600, 2), n) for group, (seconds, n) in groups.items()]
+    columns = header(query)
+
+    def sort_key(field):
+        i = columns.index(field)
+        if field == "weekday":
+            return lambda row: WEEKDAYS.index(row[i])
+        return lambda row: row[i]
+
+    # Stable sorts: tie-breaking group keys first, the ordering field last.
+    rows.sort(key=lambda row: tuple(sort_key(k)(row) for k in query.keys if k != query.order))
+    rows.sort(key=sort_key(query.order), reverse=query.desc)
+    return iter(rows[:query.limit] if query.limit is not None else rows)
+
+# --------------------------------------------------------------- output
+
+def write_table(columns, rows, out):
+    widths = [32 if c == "app" else 10 for c in columns]
+    out.write("  ".join(f"{c:<{w}}" for c, w in zip(columns, widths)).rstrip() + "\n")
+    for row in rows:
+        out.write("  ".join(f"{v!s:<{w}}" for v, w in zip(row, widths)).rstrip() + "\n")
+
+def write_csv(columns, rows, out):
+    writer = csv.writer(out)
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow(row)
+
+def write_json(columns, rows, out):
+    # A JSON array written row by row, so nothing is held back.
+    out.write("[")
+    sep = "\n"
+    for row in rows:
+        out.write(sep + json.dumps(dict(zip(columns, row))))
+        sep = ",\n"
+    out.write("\n]\n")
+
+WRITERS = {"table": write_table, "csv": write_csv, "json": write_json}
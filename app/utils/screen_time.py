@@ -1,23 +1,91 @@
 import sqlite3
 from pathlib import Path
+import calendar
 import shutil
 import tempfile
+from contextlib import contextmanager
 from datetime import datetime
 from collections import defaultdict
 
+# knowledgeC stores Core Data timestamps: seconds since 2001-01-01 UTC.
+CORE_DATA_EPOCH = 978307200
+
+def clean_app_name(bundle_id):
+    # "com.microsoft.VSCode" -> "Vscode"
+    return bundle_id.split('.')[-1].replace('-', ' ').title()
+
+FULL_DISK_ACCESS_HELP = (
+    "Access to Screen Time database denied.\n\n"
+    "1. Go to System Settings > Privacy & Security > Full Disk Access\n"
+    "2. Enable it for your Terminal (iTerm/Terminal)\n"
+    "3. Restart Terminal and try again"
+)
+
+def access_denied(error):
+    # What reading knowledgeC looks like without Full Disk Access: copying it
+    # fails with EPERM, opening it in place with SQLite's generic open error.
+    message = str(error)
+    if "Operation not permitted" in message or "Permission denied" in message:
+        return True
+    return isinstance(error, PermissionError) or (
+        isinstance(error, sqlite3.Error) and "unable to open" in message
+    )
+
 def get_screen_time_db_path():
     home = Path.home()
     db_path = home / "Library" / "Application Support" / "Knowledge" / "knowledgeC.db"
     return db_path if db_path.exists() else None
 
-def fetch_screen_time_stats(year=2025):
-    db_path = get_screen_time_db_path()
-    if not db_path:
-        return {"error": "Screen Time DB not found", "year": year}
-
+@contextmanager
+def open_screen_time_db(db_path):
+    # Work on a copy so we never hold locks on the live database.
     temp_db = Path(tempfile.gettempdir()) / "knowledgeC_temp.db"
     shutil.copy2(db_path, temp_db)
     conn = sqlite3.connect(str(temp_db))
+    try:
+        yield conn
+    finally:
+        conn.close()
+        temp_db.unlink()
+
+def year_bounds(year):
+    # Core Data seconds for [Jan 1 year, Jan 1 year+1) UTC, matching the
+    # datetime(..., 'unixepoch') comparisons in the aggregate queries.
+    start = calendar.timegm((year, 1, 1, 0, 0, 0)) - CORE_DATA_EPOCH
+    end = calendar.timegm((year + 1, 1, 1, 0, 0, 0)) - CORE_DATA_EPOCH
+    return start, end
+
+def iter_app_sessions(conn, year=2025):
+    """Yield (app, start, end) usage sessions in start order, as unix seconds.
+
+    Rows are pulled from the cursor as they're consumed; the range filter is
+    on the raw ZSTARTDATE column so SQLite can walk its index.
+    """
+    start, end = year_bounds(year)
+    cursor = conn.execute(
+        """
+        SELECT ZVALUESTRING, ZSTARTDATE + ?, ZENDDATE + ?
+        FROM ZOBJECT
+        WHERE ZSTREAMNAME LIKE '/app/usage%'
+          AND ZVALUESTRING IS NOT NULL
+          AND ZSTARTDATE >= ? AND ZSTARTDATE < ?
+          AND ZENDDATE > ZSTARTDATE
+        ORDER BY ZSTARTDATE
+        """,
+        (CORE_DATA_EPOCH, CORE_DATA_EPOCH, start, end),
+    )
+    yield from cursor
+
+def observed(sessions, *observers):
+    # Call each observer(app, start, end) as sessions stream past, so one
+    # pass over the cursor can fill several aggregates on the way to its
+    # real consumer.
+    for session in sessions:
+        for observe in observers:
+            observe(*session)
+        yield session
+
+def screen_time_stats(conn, year=2025):
     cursor = conn.cursor()
 
     start_date = f"{year}-01-01"
@@ -49,7 +117,7 @@ def fetch_screen_time_stats(year=2025):
 
     for app_name, hours, launches, longest in app_data:
         if hours and hours > 0:
-            clean_name = app_name.split('.')[-1].replace('-', ' ').title()
+            clean_name = clean_app_name(app_name)
             total_hours += hours
             total_launches += launches
             top_apps.append((clean_name, int(hours), launches, longest))
@@ -76,11 +144,13 @@ def fetch_screen_time_stats(year=2025):
     weekend_hours = 0
     weekday_hours = 0
     daily_hours_list = []
+    daily_hours = {}
     wtf_spike_day = (None, 0)
 
     for date_str, hours in daily_data:
         current_date = datetime.strptime(date_str, '%Y-%m-%d').date()
         daily_hours_list.append(hours)
+        daily_hours[date_str] = hours
         if prev_date is None or (current_date - prev_date).days == 1:
             current_streak += 1
             max_streak = max(max_streak, current_streak)
@@ -116,21 +186,6 @@ def fetch_screen_time_stats(year=2025):
     peak_hour = max(hourly_breakdown.items(), key=lambda x: x[1])[0] if any(hourly_breakdown.values()) else 12
     late_night_hours = sum(hourly_breakdown[h] for h in list(range(22, 24)) + list(range(0, 5)))
 
-    # focus sessions
-    focus_query = """
-    SELECT COUNT(*) as focus_sessions,
-           SUM((ZOBJECT.ZENDDATE - ZOBJECT.ZSTARTDATE) / 3600.0) as focus_hours
-    FROM ZOBJECT
-    WHERE ZOBJECT.ZSTREAMNAME LIKE '/app/usage%'
-      AND (ZOBJECT.ZENDDATE - ZOBJECT.ZSTARTDATE) / 3600.0 >= 2
-      AND datetime(ZOBJECT.ZSTARTDATE + 978307200, 'unixepoch') >= ?
-      AND datetime(ZOBJECT.ZSTARTDATE + 978307200, 'unixepoch') < ?
-    """
-    cursor.execute(focus_query, (start_date, end_date))
-    focus_row = cursor.fetchone() or (0, 0)
-    focus_sessions = int(focus_row[0] or 0)
-    focus_hours = float(focus_row[1] or 0)
-
     # forgotten app
     unused_query = """
     SELECT ZOBJECT.ZVALUESTRING as app_name,
@@ -146,10 +201,7 @@ def fetch_screen_time_stats(year=2025):
     """
     cursor.execute(unused_query, (start_date, end_date))
     unused = cursor.fetchone()
-    forgotten_app = unused[0].split('.')[-1].replace('-', ' ').title() if unused else "None"
-
-    conn.close()
-    temp_db.unlink()
+    forgotten_app = clean_app_name(unused[0]) if unused else "None"
 
     return {
         "year": year,
@@ -160,11 +212,10 @@ def fetch_screen_time_stats(year=2025):
         "max_streak": max_streak,
         "weekend_hours": int(weekend_hours),
         "weekday_hours": int(weekday_hours),
+        "daily_hours": daily_hours,
         "hourly_breakdown": hourly_breakdown,
         "peak_hour": peak_hour,
         "late_night_hours": int(late_night_hours),
-        "focus_sessions": focus_sessions,
-        "focus_hours": int(focus_hours),
         "forgotten_app": forgotten_app,
         "wtf_spike_day": wtf_spike_day,
     }
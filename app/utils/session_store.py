@@ -0,0 +1,151 @@
+import logging
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from app.utils.screen_time import get_screen_time_db_path, open_screen_time_db
+from app.utils.storage import data_dir
+
+log = logging.getLogger(__name__)
+
+# knowledgeC only keeps a few weeks of /app/usage. `macwrap collect` copies new
+# sessions into this store, which keeps knowledgeC's ZOBJECT column names so
+# the screen_time queries run against either database unchanged.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS ZOBJECT (
+    Z_PK INTEGER PRIMARY KEY,
+    ZSTREAMNAME TEXT NOT NULL,
+    ZVALUESTRING TEXT NOT NULL,
+    ZSTARTDATE REAL NOT NULL,
+    ZENDDATE REAL,
+    UNIQUE (ZSTREAMNAME, ZVALUESTRING, ZSTARTDATE)
+);
+CREATE INDEX IF NOT EXISTS ZOBJECT_ZSTARTDATE ON ZOBJECT (ZSTARTDATE);
+CREATE TABLE IF NOT EXISTS macwrap_meta (key TEXT PRIMARY KEY, value);
+"""
+
+def session_store_path():
+    return data_dir() / "sessions.db"
+
+def open_session_store(path=None):
+    conn = sqlite3.connect(str(path or session_store_path()))
+    # WAL lets a wrap read while a scheduled collect is writing.
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+def get_meta(conn, key, default=None):
+    row = conn.execute("SELECT value FROM macwrap_meta WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else default
+
+def set_meta(conn, key, value):
+    conn.execute("INSERT OR REPLACE INTO macwrap_meta (key, value) VALUES (?, ?)", (key, value))
+
+def read_only_uri(db_path):
+    # as_uri() only takes absolute paths; --db is often relative.
+    return Path(db_path).resolve().as_uri() + "?mode=ro"
+
+@contextmanager
+def open_source_db(db_path):
+    # Read knowledgeC in place when SQLite allows a read-only connection;
+    # copying the whole database each tick is what would cost real time.
+    conn = None
+    try:
+        conn = sqlite3.connect(read_only_uri(db_path), uri=True)
+        conn.execute("SELECT 1 FROM ZOBJECT LIMIT 1")
+    except (sqlite3.Error, ValueError):
+        if conn is not None:
+            conn.close()
+        conn = None
+    if conn is None:
+        with open_screen_time_db(db_path) as conn:
+            yield conn
+        return
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+def source_identity(db_path):
+    # Z_PK marks are only comparable within one database file.
+    path = Path(db_path).resolve()
+    return f"{path}#{path.stat().st_ino}"
+
+def copy_new_sessions(source, store, source_id=None):
+    """Copy /app/usage rows past the stored high-water mark; returns rows added.
+
+    The mark is knowledgeC's Z_PK, which only grows, so a tick is one primary
+    key range scan. If the source's largest Z_PK is below the mark the
+    database was recreated, and if `source_id` differs from the one saved
+    with the mark the store is being fed from another database; either way
+    everything is offered again and the UNIQUE constraint drops rows the
+    store already has.
+    """
+    mark = get_meta(store, "source_high_water", 0)
+    if source_id is not None and get_meta(store, "source") != source_id:
+        mark = 0
+    newest = source.execute("SELECT MAX(Z_PK) FROM ZOBJECT").fetchone()[0] or 0
+    if newest < mark:
+        mark = 0
+    rows = source.execute(
+        """
+        SELECT ZSTREAMNAME, ZVALUESTRING, ZSTARTDATE, ZENDDATE
+        FROM ZOBJECT
+        WHERE Z_PK > ? AND Z_PK <= ?
+          AND ZSTREAMNAME LIKE '/app/usage%'
+          AND ZVALUESTRING IS NOT NULL
+          AND ZSTARTDATE IS NOT NULL
+        """,
+        (mark, newest),
+    )
+    before = store.total_changes
+    with store:
+        store.executemany(
+            "INSERT OR IGNORE INTO ZOBJECT (ZSTREAMNAME, ZVALUESTRING, ZSTARTDATE, ZENDDATE) VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        added = store.total_changes - before
+        set_meta(store, "source_high_water", newest)
+        if source_id is not None:
+            set_meta(store, "source", source_id)
+        set_meta(store, "last_collect", time.time())
+    return added
+
+def collect(db_path=None, store_path=None):
+    db_path = db_path or get_screen_time_db_path()
+    if not db_path:
+        return 0
+    store = open_session_store(store_path)
+    try:
+        with open_source_db(db_path) as source:
+            return copy_new_sessions(source, store, source_identity(db_path))
+    finally:
+        store.close()
+
+@contextmanager
+def open_usage_db(db_path, store_path=None):
+    """Connection for the wrap: the session store, topped up from knowledgeC.
+
+    A failed top-up (knowledgeC locked or unreadable) still reads the store
+    as it is. Falls back to a copy of knowledgeC itself only if the store
+    can't be used, so a broken store never costs the user their wrap.
+    """
+    if db_path:
+        try:
+            collect(db_path, store_path)
+        except (sqlite3.Error, OSError, ValueError) as e:
+            log.warning("could not collect new sessions from %s: %s", db_path, e)
+    try:
+        conn = open_session_store(store_path)
+    except (sqlite3.Error, OSError, ValueError):
+        if not db_path:
+            raise
+        conn = None
+    if conn is None:
+        with open_screen_time_db(db_path) as conn:
+            yield conn
+        return
+    try:
+        yield conn
+    finally:
+        conn.close()
@@ -1,24 +1,49 @@
-from app.utils.screen_time import fetch_screen_time_stats
-from app.utils.history import get_command_history
+from collections import deque
+from app.utils.screen_time import get_screen_time_db_path, screen_time_stats, iter_app_sessions, observed
+from app.utils.session_store import session_store_path, open_usage_db
+from app.utils.history import get_command_stats
 from app.utils.filesystem import get_file_creation_stats
-from app.utils.power import get_power_events
+from app.utils.timeline import get_power_timeline
 from app.utils.personality import generate_personality
+from app.utils.streaks import DayOccupancy, app_streaks
+from app.utils.histogram import SessionLengths
+from app.utils.switches import ContextSwitches
+from app.utils.focus import FocusBlocks
 
 def get_all_stats(year=2025):
-    st = fetch_screen_time_stats(year)
-    if "error" in st:
-        res = {
-            **st,
+    db_path = get_screen_time_db_path()
+    if not db_path and not session_store_path().exists():
+        return {
+            "error": "Screen Time DB not found",
+            "year": year,
             "command_count": 0,
-            "file_stats": {"total": 0, "top_types": []},
+            "command_stats": {},
+            "file_stats": {"total": 0, "top_types": [], "truncated": False},
             "power_events": {"sleeps": 0, "wakes": 0, "reboots": 0},
+            "awake_usage": {},
             "personality": "Mac User"
         }
-        return res
 
-    command_count = get_command_history()
+    # The wrap reads macwrap's own session store, which outlives knowledgeC's
+    # few weeks of retention when `macwrap collect` runs on a schedule.
+    with open_usage_db(db_path) as conn:
+        st = screen_time_stats(conn, year)
+        # Sessions stream straight from the cursor into the power-log join,
+        # filling the per-app aggregates on the way.
+        occupancy = DayOccupancy(year)
+        lengths = SessionLengths()
+        switches = ContextSwitches()
+        focus = FocusBlocks()
+        sessions = observed(
+            iter_app_sessions(conn, year), occupancy.add, lengths.add, switches.add, focus.add
+        )
+        power_events, awake_usage = get_power_timeline(year, sessions)
+        # Whatever the join didn't get to (or all of it, without pmset).
+        deque(sessions, maxlen=0)
+    st.update(focus.summary())
+
+    command_stats = get_command_stats(year)
     file_stats = get_file_creation_stats(year)
-    power_events = get_power_events(year)
     personality = generate_personality(
         st.get("top_apps", []),
         st.get("total_hours", 0),
@@ -28,9 +53,14 @@ def get_all_stats(year=2025):
     )
     merged = {
         **st,
-        "command_count": command_count,
+        "command_count": command_stats["count"],
+        "command_stats": command_stats,
         "file_stats": file_stats,
         "power_events": power_events,
+        "awake_usage": awake_usage,
+        "app_streaks": app_streaks(occupancy),
+        "session_lengths": lengths.summary(),
+        "context_switches": switches.summary(),
         "personality": personality
     }
     return merged
@@ -0,0 +1,12 @@
+import os
+from pathlib import Path
+
+def data_dir():
+    # Where macwrap keeps its own indexes and stores. MACWRAP_HOME overrides it.
+    override = os.environ.get("MACWRAP_HOME")
+    if override:
+        path = Path(override).expanduser()
+    else:
+        path = Path.home() / "Library" / "Application Support" / "macwrap"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
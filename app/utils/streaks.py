@@ -0,0 +1,83 @@
+import calendar
+import time
+from app.utils.screen_time import clean_app_name
+
+# One Python int per app with bit d set when the app was used on day d of
+# the year (UTC, like the daily query). A year is 366 bits, six machine
+# words, so every per-app figure below is a handful of big-int operations
+# instead of a walk over 366 days.
+
+class DayOccupancy:
+    """Per-app day bitsets for one year, filled one session at a time."""
+
+    def __init__(self, year):
+        self.year = year
+        self.start = calendar.timegm((year, 1, 1, 0, 0, 0))
+        self.days = 366 if calendar.isleap(year) else 365
+        self.bits = {}
+
+    def add(self, app, start, end):
+        first = int(start - self.start) // 86400
+        last = int(end - self.start) // 86400
+        if last < 0 or first >= self.days:
+            return
+        first, last = max(first, 0), min(last, self.days - 1)
+        # Bits first..last at once; a session crossing midnight counts for both days.
+        self.bits[app] = self.bits.get(app, 0) | ((1 << (last - first + 1)) - 1) << first
+
+    def last_day(self, now=None):
+        # Streaks are "current" as of today, or the year's last day once it's over.
+        day = (int(now if now is not None else time.time()) - self.start) // 86400
+        return min(max(day, 0), self.days - 1)
+
+def longest_run(bits):
+    """Length of the longest run of set bits, in O(log run) big-int steps.
+
+    f(k) = bits & bits>>1 & ... & bits>>(k-1) is non-zero iff there is a run
+    of k ones. Double k while f(k) survives, then add back the halves
+    largest-first: f(a + b) = f(a) & f(b) >> a.
+    """
+    if not bits:
+        return 0
+    run, current = 1, bits
+    powers = [(1, bits)]
+    while True:
+        doubled = current & (current >> run)
+        if not doubled:
+            break
+        current, run = doubled, run * 2
+        powers.append((run, current))
+    for k, f_k in reversed(powers[:-1]):
+        longer = current & (f_k >> run)
+        if longer:
+            current, run = longer, run + k
+    return run
+
+def day_stats(bits, last_day):
+    """(longest streak, current streak, longest gap, active days) for one bitset.
+
+    The current streak ends on last_day (or the day before, so a streak
+    isn't broken just because today hasn't been used yet). Gaps count only
+    between the first and last active day.
+    """
+    if not bits:
+        return 0, 0, 0, 0
+    below = bits & ((1 << (last_day + 1)) - 1)
+    if not below >> last_day & 1:
+        last_day -= 1
+    # Highest unset bit at or below last_day bounds the current run.
+    unset = ~below & ((1 << (last_day + 1)) - 1) if last_day >= 0 else 0
+    current = last_day + 1 - unset.bit_length() if last_day >= 0 else 0
+    low = (bits & -bits).bit_length() - 1
+    span = ((1 << bits.bit_length()) - 1) & ~((1 << low) - 1)
+    return longest_run(bits), current, longest_run(~bits & span), bits.bit_count()
+
+def app_streaks(occupancy, top=5, now=None):
+    """Best per-app streaks: [(app, longest, current, longest_gap, active_days)]."""
+    last_day = occupancy.last_day(now)
+    rows = [
+        (clean_app_name(app), *day_stats(bits, last_day))
+        for app, bits in occupancy.bits.items()
+    ]
+    rows.sort(key=lambda row: (row[1], row[4]), reverse=True)
+    return rows[:top]
@@ -0,0 +1,64 @@
+from collections import Counter
+from app.utils.localtime import LocalClock
+from app.utils.screen_time import clean_app_name
+
+# Going from one app's session to another's within this many seconds is a
+# context switch; a longer pause is coming back to the Mac, not switching.
+SWITCH_GAP = 300
+# Distinct app->app pairs tracked for the transition matrix.
+MAX_PAIRS = 256
+
+class ContextSwitches:
+    """Counts app switches in a start-ordered session stream.
+
+    Per local hour of day and per local day are plain counters (24 and at
+    most 366 entries). The app->app matrix is bounded like the command trie: once it
+    holds twice MAX_PAIRS pairs it is cut back to the MAX_PAIRS most
+    frequent, so memory stays fixed and the frequent pairs survive.
+    """
+
+    def __init__(self, gap=SWITCH_GAP, max_pairs=MAX_PAIRS):
+        self.gap = gap
+        self.max_pairs = max_pairs
+        self.hourly = [0] * 24
+        self.daily = Counter()
+        self.active_hours = set()
+        self.local = LocalClock(lambda t: (f"{t.tm_year}-{t.tm_mon:02d}-{t.tm_mday:02d}", t.tm_hour))
+        self.pairs = {}
+        self.total = 0
+        self._last = None
+        self._last_end = None
+
+    def add(self, app, start, end):
+        local = self.local(start)
+        self.active_hours.add(local)
+        last = self._last
+        if last is not None and app != last and start - self._last_end < self.gap:
+            self.total += 1
+            self.hourly[local[1]] += 1
+            self.daily[local[0]] += 1
+            self.count_pair((last, app))
+        self._last = app
+        # Overlapping sessions: keep the latest end seen.
+        if self._last_end is None or end > self._last_end:
+            self._last_end = end
+
+    def count_pair(self, pair):
+        pairs = self.pairs
+        pairs[pair] = pairs.get(pair, 0) + 1
+        if len(pairs) > 2 * self.max_pairs:
+            kept = sorted(pairs.items(), key=lambda kv: kv[1], reverse=True)[:self.max_pairs]
+            self.pairs = dict(kept)
+
+    def summary(self, top=5):
+        busiest = self.daily.most_common(1)
+        return {
+            "switches": self.total,
+            "per_active_hour": round(self.total / len(self.active_hours), 1) if self.active_hours else 0,
+            "hourly": list(self.hourly),
+            "busiest_day": busiest[0] if busiest else (None, 0),
+            "top_pairs": [
+                (clean_app_name(a), clean_app_name(b), n)
+                for (a, b), n in sorted(self.pairs.items(), key=lambda kv: kv[1], reverse=True)[:top]
+            ],
+        }
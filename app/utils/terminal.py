@@ -0,0 +1,16 @@
+import os
+
+# Frame-rate cap applied when motion is reduced; Textual's default is 60.
+REDUCED_MOTION_FPS = 15
+
+def detect_low_bandwidth(environ=None):
+    environ = os.environ if environ is None else environ
+    override = environ.get("MACWRAP_REDUCED_MOTION")
+    if override is not None:
+        return override.lower() not in ("", "0", "false", "no")
+    # Remote sessions and multiplexers pay for every repainted cell.
+    if environ.get("SSH_CONNECTION") or environ.get("SSH_TTY"):
+        return True
+    if environ.get("TMUX") or environ.get("STY"):
+        return True
+    return environ.get("TERM", "") in ("dumb", "linux")
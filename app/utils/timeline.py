@@ -0,0 +1,103 @@
+from collections import Counter
+from app.utils.power import new_power_tally, tallied, power_summary, parse_pmset_lines, stream_pmset_log
+from app.utils.screen_time import clean_app_name
+
+# Upper bounds (seconds) of the wake-to-first-app latency buckets.
+LATENCY_BUCKETS = (10, 60, 300, 1800)
+LATENCY_LABELS = ("<10s", "10s-1m", "1-5m", "5-30m", "30m+")
+
+def awake_intervals(events):
+    """Yield (wake, sleep) unix-second pairs from power events in log order.
+
+    Only full wakes open an interval; dark wakes keep the display off and
+    never bring an app to the front.
+    """
+    awake_since = None
+    for event in events:
+        if event.kind == "wake":
+            if awake_since is None:
+                awake_since = event.timestamp.timestamp()
+        elif event.kind in ("sleep", "shutdown", "restart", "boot"):
+            if awake_since is not None:
+                ts = event.timestamp.timestamp()
+                if ts > awake_since:
+                    yield awake_since, ts
+                awake_since = None
+
+def latency_bucket(seconds):
+    for i, bound in enumerate(LATENCY_BUCKETS):
+        if seconds < bound:
+            return i
+    return len(LATENCY_BUCKETS)
+
+def join_awake_sessions(intervals, sessions):
+    """Merge-join sorted awake intervals with sorted (app, start, end) sessions.
+
+    One forward pass over each side, O(n + m). A session spanning a sleep is
+    kept for the next interval. Overlapping sessions are counted once towards
+    covered time.
+    """
+    sessions = iter(sessions)
+    session = next(sessions, None)
+    awake_seconds = idle_seconds = 0.0
+    before_sleep = Counter()
+    latency = [0] * (len(LATENCY_BUCKETS) + 1)
+    latency_total, latency_count = 0.0, 0
+
+    for wake, sleep in intervals:
+        # Sessions that ended before this wake can't touch it.
+        while session is not None and session[2] <= wake:
+            session = next(sessions, None)
+        covered = 0.0
+        cursor = wake
+        first_start = None
+        last_app = None
+        while session is not None and session[1] < sleep:
+            app, start, end = session
+            lo, hi = max(start, cursor), min(end, sleep)
+            if hi > lo:
+                covered += hi - lo
+                cursor = hi
+            if first_start is None and start >= wake:
+                first_start = start
+            last_app = app
+            if end > sleep:
+                break
+            session = next(sessions, None)
+        awake_seconds += sleep - wake
+        idle_seconds += (sleep - wake) - covered
+        if last_app is not None:
+            before_sleep[last_app] += 1
+        if first_start is not None:
+            waited = first_start - wake
+            latency[latency_bucket(waited)] += 1
+            latency_total += waited
+            latency_count += 1
+
+    return {
+        "awake_hours": round(awake_seconds / 3600, 1),
+        "idle_awake_hours": round(idle_seconds / 3600, 1),
+        "top_before_sleep": [
+            (clean_app_name(app), n) for app, n in before_sleep.most_common(5)
+        ],
+        "wake_to_app": dict(zip(LATENCY_LABELS, latency)),
+        "avg_wake_to_app_seconds": round(latency_total / latency_count, 1) if latency_count else 0,
+    }
+
+def pmset_events(year, tally, failed):
+    # The pmset side of the join. A missing pmset or an unreadable log ends
+    # the event stream and is recorded in `failed`; errors from the session
+    # side are raised in the join itself and propagate to the caller.
+    try:
+        yield from tallied(parse_pmset_lines(stream_pmset_log(), year), tally)
+    except Exception:
+        failed.append(True)
+
+def get_power_timeline(year, sessions):
+    """One pmset pass: the power summary plus the awake/app-session join."""
+    tally = new_power_tally()
+    failed = []
+    awake = join_awake_sessions(awake_intervals(pmset_events(year, tally, failed)), sessions)
+    if failed:
+        return {"sleeps": 0, "wakes": 0, "reboots": 0}, {}
+    return power_summary(tally), awake
@@ -0,0 +1,39 @@
+from textual.app import App
+from textual.containers import Center, Middle
+from textual.widgets import Static, Header, Footer
+from app.macwrap_app import MacWrap
+from app.screens.watch import render
+
+class MacWrapWatch(App):
+    """Live dashboard over a LiveUsage; redraws only when something changed."""
+
+    CSS = MacWrap.CSS
+    BINDINGS = [("q", "quit", "Quit")]
+    TITLE = "macwrap watch"
+    # Seconds between PRAGMA data_version checks.
+    POLL_INTERVAL = 2.0
+
+    def __init__(self, usage, poll_interval=POLL_INTERVAL):
+        super().__init__()
+        self.usage = usage
+        self.poll_interval = poll_interval
+
+    def compose(self):
+        yield Header()
+        with Center():
+            with Middle():
+                yield Static(id="dashboard")
+        yield Footer()
+
+    def on_mount(self):
+        self.dark = True
+        self.usage.refresh()
+        self.redraw()
+        self.set_interval(self.poll_interval, self.poll)
+
+    def poll(self):
+        if self.usage.refresh():
+            self.redraw()
+
+    def redraw(self):
+        self.query_one("#dashboard", Static).update(render(self.usage.snapshot()))
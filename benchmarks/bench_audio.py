@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Latency from cue request to playback start, and behaviour under key mashing.
+
+Run from the repo root:  python3 benchmarks/bench_audio.py [--backend null|afplay|paplay|aplay]
+
+Uses a generated silent WAV so it works without the bundled sounds.
+"""
+import argparse
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import wave
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.utils.audio import AudioPlayer, NullBackend, BACKENDS
+
+def write_silence(path, seconds=0.2, rate=22050):
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(b"\0\0" * int(rate * seconds))
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="null", choices=["null", *BACKENDS])
+    parser.add_argument("--cues", type=int, default=200)
+    args = parser.parse_args()
+
+    backend = NullBackend() if args.backend == "null" else BACKENDS[args.backend]()
+    latencies = []
+    started = threading.Event()
+
+    def on_start(name, requested_at, started_at):
+        latencies.append(started_at - requested_at)
+        started.set()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_silence(Path(tmp) / "tick.wav")
+        player = AudioPlayer(backend, sounds_dir=tmp, on_start=on_start)
+
+        # Paced cues: one at a time, as a user stepping through slides.
+        for _ in range(args.cues):
+            started.clear()
+            player.cue("tick")
+            started.wait(1)
+            time.sleep(0.005)
+        paced = sorted(latencies)
+        print(
+            f"{args.backend}: cue -> start p50 {statistics.median(paced) * 1000:.2f} ms, "
+            f"p99 {paced[int(len(paced) * 0.99) - 1] * 1000:.2f} ms over {len(paced)} cues"
+        )
+
+        # Burst: 100 cues as fast as possible; stale ones must be dropped.
+        latencies.clear()
+        player.dropped = 0
+        for _ in range(100):
+            player.cue("tick")
+        time.sleep(0.5)
+        print(f"burst of 100: played {len(latencies)}, dropped {player.dropped}, "
+              f"worst start {max(latencies) * 1000:.2f} ms")
+        player.close()
+
+if __name__ == "__main__":
+    main()
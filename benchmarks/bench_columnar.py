@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Per-app totals for a year: SQLite rows vs. the columnar month partitions.
+
+Builds a knowledgeC-shaped database of generated sessions, converts it, then
+times loading each way.
+
+Run from the repo root:  python3 benchmarks/bench_columnar.py [--sessions 1000000]
+"""
+import argparse
+import calendar
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.utils import columnar
+from app.utils.screen_time import CORE_DATA_EPOCH, iter_app_sessions
+
+def write_fixture(path, sessions, apps=300, seed=5):
+    rng = random.Random(seed)
+    names = [f"com.example.app{i}" for i in range(apps)]
+    weights = [1 / (i + 1) for i in range(apps)]
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE ZOBJECT (Z_PK INTEGER PRIMARY KEY, ZSTREAMNAME TEXT, ZVALUESTRING TEXT, ZSTARTDATE REAL, ZENDDATE REAL)")
+    conn.execute("CREATE INDEX ZOBJECT_ZSTARTDATE ON ZOBJECT (ZSTARTDATE)")
+    step = (365 * 86400) / sessions
+    t = calendar.timegm((2025, 1, 1, 0, 0, 0)) - CORE_DATA_EPOCH
+
+    def rows():
+        nonlocal t
+        picks = rng.choices(names, weights, k=sessions)
+        for app in picks:
+            yield ("/app/usage", app, t, t + rng.randint(1, 3600))
+            t += step
+
+    conn.executemany("INSERT INTO ZOBJECT (ZSTREAMNAME, ZVALUESTRING, ZSTARTDATE, ZENDDATE) VALUES (?,?,?,?)", rows())
+    conn.commit()
+    conn.close()
+
+def sqlite_totals(path, year):
+    conn = sqlite3.connect(path)
+    totals = {}
+    for app, start, end in iter_app_sessions(conn, year):
+        seconds, count = totals.get(app, (0, 0))
+        totals[app] = (seconds + int(end) - int(start), count + 1)
+    conn.close()
+    return totals
+
+def timed(label, fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    print(f"{label:<28} {time.perf_counter() - start:8.3f}s")
+    return result
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=1_000_000)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Path(tmp) / "knowledgeC.db"
+        root = Path(tmp) / "columns"
+        write_fixture(db, args.sessions)
+        print(f"{args.sessions:,} sessions, NumPy {'on' if columnar.numpy is not None else 'off'}")
+
+        timed("convert", columnar.convert_db, db, root)
+        rows = timed("sqlite rows -> totals", sqlite_totals, db, 2025)
+        cols = timed("columns -> totals", columnar.app_totals, 2025, root)
+        assert len(rows) == len(cols) and sum(c for _, c in rows.values()) == sum(c for _, c in cols.values())
+
+        size = sum(p.stat().st_size for p in root.iterdir())
+        print(f"sqlite file {db.stat().st_size / 1e6:8.1f} MB, columns {size / 1e6:8.1f} MB")
+
+if __name__ == "__main__":
+    main()
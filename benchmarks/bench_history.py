@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Shell history parsing throughput on a generated zsh EXTENDED_HISTORY file.
+
+Run from the repo root:  python3 benchmarks/bench_history.py [--lines 10000000]
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.utils.history import parse_history_file, command_stats, collect_history
+
+COMMANDS = [b"git status", b"git commit -m wip", b"ls -la", b"cd ..", b"docker compose up",
+            b"python3 manage.py test", b"vim README.md", b"make -j8", b"brew upgrade"]
+
+def write_fixture(path, lines, seed=1):
+    rng = random.Random(seed)
+    ts = 1704067200  # 2024-01-01
+    written = 0
+    with open(path, "wb") as f:
+        buf = []
+        while written < lines:
+            ts += rng.randint(1, 20)
+            cmd = rng.choice(COMMANDS)
+            if rng.random() < 0.05:
+                # multi-line continuation: two physical lines, one command
+                buf.append(b": %d:%d;%s \\\n  --verbose\n" % (ts, rng.randint(0, 90), cmd))
+                written += 2
+            else:
+                buf.append(b": %d:%d;%s\n" % (ts, rng.randint(0, 90), cmd))
+                written += 1
+            if len(buf) >= 100_000:
+                f.writelines(buf)
+                buf.clear()
+        f.writelines(buf)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lines", type=int, default=10_000_000)
+    parser.add_argument("--year", type=int, default=2024)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / ".zsh_history"
+        start = time.perf_counter()
+        write_fixture(path, args.lines)
+        size = path.stat().st_size
+        print(f"fixture: {args.lines:,} lines, {size / 2**20:.0f} MiB in {time.perf_counter() - start:.1f}s")
+
+        start = time.perf_counter()
+        summary, _ = parse_history_file(path)
+        elapsed = time.perf_counter() - start
+        stats = command_stats(summary, args.year)
+        total = sum(stats["per_year"].values())
+        print(f"parse:   {elapsed:.2f}s, {size / 2**20 / elapsed:.0f} MiB/s, {total:,} commands")
+        print(f"per year: {stats['per_year']}")
+        tries = [entry["commands"]["size"] for entry in summary["years"].values()]
+        print(f"trie nodes per year: {tries}, top: {stats['top_commands'][:3]}")
+
+        index = Path(tmp) / "history_index.json"
+        collect_history([path], index_file=index)
+        with open(path, "ab") as f:
+            f.writelines(b": %d:0;ls\n" % (1735689600 + i) for i in range(1000))
+        start = time.perf_counter()
+        collect_history([path], index_file=index)
+        print(f"incremental (1,000 appended lines): {(time.perf_counter() - start) * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
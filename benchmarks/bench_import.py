@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Cold-start import cost of macwrap.py, measured with `python -X importtime`.
+
+macwrap.py defers importing the Textual app until after argument parsing, so
+both are imported here to cover what a normal launch loads.
+
+Run from the repo root:  python3 benchmarks/bench_import.py [--runs N]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+def parse_importtime(stderr):
+    # Lines look like: "import time:       412 |       1033 |   app.screens.intro"
+    rows = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, self_us, cumulative_us, name = [p.strip() for p in line.replace("import time:", "|", 1).split("|")]
+        rows[name] = (int(self_us), int(cumulative_us))
+    return rows
+
+def run_once():
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import macwrap, app.macwrap_app"],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(proc.stderr)
+    return parse_importtime(proc.stderr)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    totals, app_self, screens = [], [], set()
+    for _ in range(args.runs):
+        rows = run_once()
+        totals.append(rows["macwrap"][1] + rows["app.macwrap_app"][1])
+        app_self.append(sum(s for name, (s, _) in rows.items() if name.startswith("app.")))
+        screens |= {name for name in rows if name.startswith("app.screens.")}
+
+    print(f"macwrap + app (cumulative): {statistics.median(totals) / 1000:.1f} ms median over {args.runs} runs")
+    print(f"app.* modules (self):       {statistics.median(app_self) / 1000:.1f} ms")
+    print(f"screen modules imported:    {len(screens)} ({', '.join(sorted(screens))})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Bytes written to the terminal per slide transition, full vs reduced motion.
+
+Each mode runs in its own interpreter because TEXTUAL_FPS is read when Textual
+is imported.
+
+Run from the repo root:  python3 benchmarks/bench_motion.py
+"""
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SETTLE = 0.3
+
+def run_child(reduced):
+    sys.path.insert(0, str(ROOT))
+    import textual.drivers.headless_driver as headless
+    from app.macwrap_app import MacWrap
+    from benchmarks.fixtures import sample_stats
+
+    written = [0]
+
+    class CountingDriver(headless.HeadlessDriver):
+        # Headless apps normally skip painting; pretend to be a real
+        # terminal and count what would have gone down the wire.
+        @property
+        def is_headless(self):
+            return False
+
+        def write(self, data):
+            written[0] += len(data.encode("utf-8"))
+
+    headless.HeadlessDriver = CountingDriver
+
+    async def measure():
+        per_transition = []
+        app = MacWrap(stats=sample_stats(), reduced_motion=reduced)
+        async with app.run_test(size=(100, 40)) as pilot:
+            screen = app.screen
+            screen.show("total_time")
+            await pilot.pause(screen.slide["duration"] + SETTLE)
+            while screen.slide["next"]:
+                written[0] = 0
+                await pilot.press("space")
+                await pilot.pause(screen.slide["duration"] + SETTLE)
+                per_transition.append(written[0])
+        return per_transition
+
+    print(json.dumps(asyncio.run(measure())))
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        run_child(sys.argv[2] == "reduced")
+        return
+    for mode in ("full", "reduced"):
+        env = dict(os.environ)
+        env.pop("TEXTUAL_FPS", None)
+        if mode == "reduced":
+            from app.utils.terminal import REDUCED_MOTION_FPS
+            env["TEXTUAL_FPS"] = str(REDUCED_MOTION_FPS)
+        proc = subprocess.run(
+            [sys.executable, __file__, "--child", mode],
+            cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+        )
+        sizes = json.loads(proc.stdout.strip().splitlines()[-1])
+        print(
+            f"{mode:8}: median {statistics.median(sizes) / 1024:.1f} KiB, "
+            f"total {sum(sizes) / 1024:.1f} KiB over {len(sizes)} transitions"
+        )
+
+if __name__ == "__main__":
+    sys.path.insert(0, str(ROOT))
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Batch personality classification throughput.
+
+Run from the repo root:  python3 benchmarks/bench_personality.py [--records 100000]
+"""
+import argparse
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.utils.personality import PersonalityMatcher
+
+APPS = ["Google Chrome", "Safari", "Vscode", "Xcode", "Terminal", "Iterm2", "Spotify", "Slack",
+        "Figma", "Notion", "Mail", "Zoom", "Photoshop", "Firefox", "Messages", "Finder"]
+
+def make_records(n, seed=11):
+    rng = random.Random(seed)
+    records = []
+    for _ in range(n):
+        apps = rng.sample(APPS, 5)
+        top_apps = [(name, rng.randint(10, 900), rng.randint(10, 3000), 2.0) for name in apps]
+        total = sum(a[1] for a in top_apps)
+        records.append({
+            "top_apps": top_apps,
+            "total_hours": total,
+            "peak_hour": rng.randrange(24),
+            "late_night_hours": rng.uniform(0, total * 0.5),
+            "focus_hours": rng.uniform(0, 800),
+        })
+    return records
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=100_000)
+    args = parser.parse_args()
+    records = make_records(args.records)
+
+    start = time.perf_counter()
+    matcher = PersonalityMatcher()
+    compiled = time.perf_counter()
+    results = matcher.classify_batch(records)
+    done = time.perf_counter()
+    print(f"compile: {(compiled - start) * 1000:.2f} ms")
+    print(f"classify: {args.records:,} records in {done - compiled:.2f}s "
+          f"({args.records / (done - compiled):,.0f} records/s)")
+    print("most common:", Counter(results).most_common(3))
+
+if __name__ == "__main__":
+    main()
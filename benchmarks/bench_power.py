@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""pmset log parsing throughput on a generated log.
+
+Run from the repo root:  python3 benchmarks/bench_power.py [--events 1000000]
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.utils.power import parse_pmset_lines, summarize_power_events
+
+NOISE = "Assertions          \tPID 123(WindowServer) Released UserIsActive \"com.apple.iohideventsystem\" 00:00:10\n"
+
+def write_fixture(path, events, seed=3):
+    rng = random.Random(seed)
+    ts = datetime(2025, 1, 1, 8)
+    source = "AC"
+    with open(path, "w") as f:
+        for i in range(events):
+            stamp = ts.strftime("%Y-%m-%d %H:%M:%S") + " +0100"
+            if i % 500 == 0:
+                f.write(f"{stamp} Shutdown Cause      \tShutdown Cause=5\n")
+            if rng.random() < 0.1:
+                source = "Batt" if source == "AC" else "AC"
+            asleep = rng.randint(30, 40000)
+            f.write(f"{stamp} Sleep               \tEntering Sleep state due to 'Idle Sleep':TCPKeepAlive=active Using {source} (Charge:80%)\t{asleep} secs\n")
+            ts += timedelta(seconds=asleep)
+            stamp = ts.strftime("%Y-%m-%d %H:%M:%S") + " +0100"
+            kind = "DarkWake" if rng.random() < 0.4 else "Wake    "
+            f.write(f"{stamp} {kind}            \t{kind.strip()} from Deep Idle [CDNVA] : due to EC.LidOpen/Lid Open Using {source} (Charge:80%)\t{rng.randint(5, 900)} secs\n")
+            f.writelines(NOISE for _ in range(3))
+            ts += timedelta(seconds=rng.randint(60, 7200))
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=1_000_000, help="sleep/wake pairs to generate")
+    parser.add_argument("--year", type=int, default=2025)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "pmset.log"
+        write_fixture(path, args.events)
+        size = path.stat().st_size
+        start = time.perf_counter()
+        with open(path) as f:
+            stats = summarize_power_events(parse_pmset_lines(f, args.year))
+        elapsed = time.perf_counter() - start
+        print(f"log: {size / 2**20:.0f} MiB, parsed in {elapsed:.2f}s ({size / 2**20 / elapsed:.0f} MiB/s)")
+        print(stats)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""scandir backend throughput on a generated file tree.
+
+Run from the repo root:  python3 benchmarks/bench_scandir.py [--files 1000000] [--workers 1 8 16]
+
+The tree is created under a temporary directory (or --tree, which is kept and
+reused across runs since building a million files is the slow part).
+"""
+import argparse
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.utils.filesystem import scan_file_creation_stats
+
+# Throughput is measured on full walks; the wrap's deadline is exercised
+# separately with --deadline.
+NO_DEADLINE = float("inf")
+EXTS = (".py", ".js", ".md", ".json", ".txt", ".png", ".swift", ".ts")
+PER_DIR = 500
+FANOUT = 20
+
+def build_tree(root, files):
+    marker = root / f".generated-{files}"
+    if marker.exists():
+        return
+    made = 0
+    d = 0
+    while made < files:
+        # Spread directories FANOUT-wide so the walk has depth as well as breadth.
+        parts = []
+        n = d
+        while True:
+            parts.append(f"d{n % FANOUT}")
+            n //= FANOUT
+            if not n:
+                break
+        directory = root.joinpath(*reversed(parts))
+        directory.mkdir(parents=True, exist_ok=True)
+        for i in range(min(PER_DIR, files - made)):
+            with open(directory / f"f{i}{EXTS[i % len(EXTS)]}", "wb") as f:
+                f.write(b"x" * (i % 64))
+        made += PER_DIR
+        d += 1
+    # Excluded subtree that must not be counted.
+    (root / "node_modules" / "pkg").mkdir(parents=True, exist_ok=True)
+    (root / "node_modules" / "pkg" / "index.js").write_text("")
+    marker.write_text("")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--tree", help="directory to build/reuse the tree in")
+    parser.add_argument("--deadline", type=float, default=1.0,
+                        help="per-run deadline for the runs that build the index up over several launches")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, tempfile.TemporaryDirectory() as state:
+        root = Path(args.tree) if args.tree else Path(tmp)
+        start = time.perf_counter()
+        build_tree(root, args.files)
+        print(f"tree: {args.files:,} files under {root} ({time.perf_counter() - start:.1f}s)")
+        year = date.today().year
+        for workers in args.workers:
+            start = time.perf_counter()
+            stats = scan_file_creation_stats(year, roots=[root], workers=workers, deadline=NO_DEADLINE)
+            elapsed = time.perf_counter() - start
+            print(f"workers={workers:<3} {elapsed:.2f}s  {stats['total'] / elapsed:,.0f} files/s  total={stats['total']:,}")
+
+        index = Path(state) / "file_index.bin"
+        for label in ("index cold", "index warm"):
+            start = time.perf_counter()
+            stats = scan_file_creation_stats(year, roots=[root], index_file=index, deadline=NO_DEADLINE)
+            print(f"{label}: {time.perf_counter() - start:.2f}s  total={stats['total']:,}")
+        (root / "d0" / "new.py").write_text("")
+        start = time.perf_counter()
+        stats = scan_file_creation_stats(year, roots=[root], index_file=index, deadline=NO_DEADLINE)
+        print(f"index after one new file: {time.perf_counter() - start:.2f}s  total={stats['total']:,}")
+
+        # A tree too big for one deadline: every run saves what it reached,
+        # so successive launches get further until a walk completes.
+        index = Path(state) / "deadline_index.bin"
+        for run in range(1, 101):
+            start = time.perf_counter()
+            stats = scan_file_creation_stats(year, roots=[root], index_file=index, deadline=args.deadline)
+            print(f"deadline {args.deadline}s run {run}: {time.perf_counter() - start:.2f}s  "
+                  f"total={stats['total']:,}  truncated={stats['truncated']}")
+            if not stats["truncated"]:
+                break
+
+if __name__ == "__main__":
+    main()
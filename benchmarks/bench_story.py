@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Headless walk through the whole story, from the intro slide to the credits.
+
+For every transition it records how long the slide took to build, the time
+from key press to the first frame Textual hands to the display, and how much
+traced memory grew. Results are written as JSON so CI can diff them.
+
+Run from the repo root:  python3 benchmarks/bench_story.py [--out results.json]
+"""
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.macwrap_app import MacWrap
+from benchmarks.fixtures import sample_stats
+
+async def walk(size):
+    app = MacWrap(stats=sample_stats(), reduced_motion=True)
+    frames = []
+    display = app._display
+
+    def timed_display(screen, renderable):
+        frames.append(time.perf_counter())
+        return display(screen, renderable)
+
+    app._display = timed_display
+    transitions = []
+    async with app.run_test(size=size) as pilot:
+        await pilot.pause()
+        screen = app.screen
+        content = screen.content
+        builds = []
+
+        def timed_content(name):
+            start = time.perf_counter()
+            result = content(name)
+            builds.append(time.perf_counter() - start)
+            return result
+
+        screen.content = timed_content
+        # Prerendering would hide the build cost we want to see.
+        screen.PRERENDER = False
+        screen.rendered = {screen.slide["name"]: screen.rendered[screen.slide["name"]]}
+        tracemalloc.start()
+        while True:
+            before = screen.slide["name"]
+            if screen.slide["next"] is None:
+                break
+            builds.clear()
+            frames.clear()
+            mem_before = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            await pilot.press("space")
+            await pilot.pause()
+            first_paint = next((t for t in frames if t >= start), None)
+            transitions.append({
+                "from": before,
+                "to": screen.slide["name"],
+                "build_ms": round(sum(builds) * 1000, 3),
+                "first_paint_ms": round((first_paint - start) * 1000, 3) if first_paint else None,
+                "mem_delta_kib": round((tracemalloc.get_traced_memory()[0] - mem_before) / 1024, 1),
+            })
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return transitions, peak
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--out", help="write JSON here instead of stdout")
+    parser.add_argument("--width", type=int, default=100)
+    parser.add_argument("--height", type=int, default=40)
+    args = parser.parse_args()
+
+    transitions, peak = asyncio.run(walk((args.width, args.height)))
+    result = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "size": [args.width, args.height],
+        "transitions": transitions,
+        "total_build_ms": round(sum(t["build_ms"] for t in transitions), 3),
+        "total_mem_delta_kib": round(sum(t["mem_delta_kib"] for t in transitions), 1),
+        "peak_traced_kib": round(peak / 1024, 1),
+    }
+    text = json.dumps(result, indent=2)
+    if args.out:
+        Path(args.out).write_text(text + "\n")
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    main()
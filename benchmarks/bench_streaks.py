@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Per-app day bitsets: fill them from a session stream, then derive streaks.
+
+Run from the repo root:  python3 benchmarks/bench_streaks.py [--apps 5000] [--sessions 1000000]
+"""
+import argparse
+import calendar
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.utils.streaks import DayOccupancy, app_streaks
+
+def sessions(n, apps, year=2025, seed=9):
+    rng = random.Random(seed)
+    names = [f"com.example.app{i}" for i in range(apps)]
+    weights = [1 / (i + 1) for i in range(apps)]
+    start = calendar.timegm((year, 1, 1, 0, 0, 0))
+    step = 365 * 86400 / n
+    t = start
+    for app in rng.choices(names, weights, k=n):
+        yield app, t, t + rng.randint(1, 3600)
+        t += step
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--apps", type=int, default=5000)
+    parser.add_argument("--sessions", type=int, default=1_000_000)
+    args = parser.parse_args()
+    stream = list(sessions(args.sessions, args.apps))
+
+    occupancy = DayOccupancy(2025)
+    add = occupancy.add
+    start = time.perf_counter()
+    for session in stream:
+        add(*session)
+    filled = time.perf_counter()
+    best = app_streaks(occupancy, top=5, now=calendar.timegm((2025, 12, 31, 12, 0, 0)))
+    done = time.perf_counter()
+
+    print(f"fill:    {args.sessions:,} sessions in {filled - start:.2f}s")
+    print(f"streaks: {len(occupancy.bits):,} apps in {(done - filled) * 1000:.1f} ms")
+    for row in best:
+        print("  ", row)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Key-press to repaint latency between slides, with and without prerendering.
+
+Run from the repo root:  python3 benchmarks/bench_transitions.py
+"""
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.macwrap_app import MacWrap
+from app.screens.slide import SlideScreen, build
+from app.screens.story import STORY
+from benchmarks.fixtures import sample_stats
+
+async def measure(prerender):
+    SlideScreen.PRERENDER = prerender
+    app = MacWrap(stats=sample_stats())
+    latencies = []
+    async with app.run_test(size=(100, 40)) as pilot:
+        # Tweens would dominate the timing; measure only build + repaint.
+        app.animation_level = "none"
+        await pilot.pause()
+        screen = app.screen
+        screen.show("total_time")
+        while screen.slide["next"]:
+            # Give the background worker the time an animation would.
+            await app.workers.wait_for_complete()
+            start = time.perf_counter()
+            await pilot.press("space")
+            await pilot.pause()
+            latencies.append(time.perf_counter() - start)
+    return latencies
+
+def build_costs(stats):
+    costs = {}
+    for slide in STORY:
+        start = time.perf_counter()
+        build(slide["name"], stats)
+        costs[slide["name"]] = time.perf_counter() - start
+    return costs
+
+def main():
+    costs = build_costs(sample_stats())
+    slowest = max(costs, key=costs.get)
+    print(f"slide build cost: {sum(costs.values()) * 1000:.2f} ms total, slowest {slowest} {costs[slowest] * 1000:.2f} ms")
+    for prerender in (False, True):
+        latencies = asyncio.run(measure(prerender))
+        label = "prerendered" if prerender else "inline     "
+        print(
+            f"{label}: median {statistics.median(latencies) * 1000:.2f} ms, "
+            f"max {max(latencies) * 1000:.2f} ms over {len(latencies)} transitions"
+        )
+
+if __name__ == "__main__":
+    main()
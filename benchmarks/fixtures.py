@@ -0,0 +1,62 @@
+# Deterministic stats dict shaped like app.utils.stats.get_all_stats(), used
+# by the benchmarks so they run on machines without a Screen Time database.
+import random
+from datetime import date, timedelta
+
+def sample_stats(year=2025, seed=7):
+    rng = random.Random(seed)
+    apps = ["Code", "Safari", "Terminal", "Slack", "Figma", "Spotify", "Notion", "Xcode", "Mail", "Zoom"]
+    top_apps = []
+    for i, name in enumerate(apps):
+        hours = 900 // (i + 1)
+        top_apps.append((name, hours, rng.randint(200, 5000), rng.uniform(1, 6)))
+    day = date(year, 1, 1)
+    daily_hours = {}
+    while day.year == year:
+        daily_hours[day.isoformat()] = round(rng.uniform(0, 14), 2)
+        day += timedelta(days=1)
+    hourly = {h: rng.uniform(10, 300) if 8 <= h <= 23 else rng.uniform(0, 40) for h in range(24)}
+    total_hours = sum(h for _, h, _, _ in top_apps)
+    return {
+        "year": year,
+        "total_hours": total_hours,
+        "top_apps": top_apps,
+        "total_launches": sum(l for _, _, l, _ in top_apps),
+        "longest_session": ("Code", 5.7),
+        "max_streak": 61,
+        "context_switches": {
+            "switches": 61240, "per_active_hour": 21.4, "hourly": [rng.randint(0, 900) for _ in range(24)],
+            "busiest_day": (f"{year}-05-02", 611),
+            "top_pairs": [("Code", "Safari", 8120), ("Safari", "Code", 7992), ("Slack", "Code", 3310)],
+        },
+        "session_lengths": {
+            "sessions": 48210, "p50_seconds": 423.5, "p90_seconds": 1375.5, "p99_seconds": 9471.5,
+            "typical_by_app": [("Code", 1311.5), ("Safari", 247.5), ("Terminal", 95.5)],
+        },
+        "app_streaks": [("Code", 48, 12, 9, 301), ("Safari", 33, 33, 6, 288), ("Terminal", 21, 0, 14, 240)],
+        "weekend_hours": total_hours // 4,
+        "weekday_hours": total_hours - total_hours // 4,
+        "daily_hours": daily_hours,
+        "hourly_breakdown": hourly,
+        "peak_hour": max(hourly, key=hourly.get),
+        "late_night_hours": int(sum(hourly[h] for h in (22, 23, 0, 1, 2, 3, 4))),
+        "focus_sessions": 142,
+        "focus_hours": 390,
+        "top_focus_apps": [("Code", 241.5, 88), ("Figma", 71.0, 25), ("Xcode", 40.2, 14)],
+        "forgotten_app": "Chess",
+        "wtf_spike_day": (f"{year}-03-14", 15.2),
+        "personality": "Night Owl Code Wizard",
+        "command_count": 48210,
+        "command_stats": {
+            "top_commands": [
+                ("git", 18211, [("commit", 6120), ("push", 3004), ("status", 2877)]),
+                ("docker", 5120, [("compose", 3380), ("ps", 610)]),
+                ("ls", 4702, []),
+                ("python3", 2210, []),
+                ("brew", 930, [("install", 401), ("upgrade", 280)]),
+            ],
+        },
+        "file_stats": {"total": 1234, "top_types": [(".py", 400), (".md", 120)]},
+        "awake_usage": {"awake_hours": 1980.4, "idle_awake_hours": 311.2, "top_before_sleep": [("Safari", 140), ("Code", 96)]},
+        "power_events": {"sleeps": 812, "wakes": 830, "dark_wakes": 2210, "reboots": 9, "median_sleep_minutes": 412.5},
+    }
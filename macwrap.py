@@ -1,5 +1,160 @@
 #!/usr/bin/env python3
-from app.macwrap_app import MacWrap
+import argparse
+import os
+import sqlite3
+import sys
+from pathlib import Path
+from app.utils.terminal import detect_low_bandwidth, REDUCED_MOTION_FPS
+
+def export(args):
+    from app.export import export_cards, save_snapshot, snapshot_labels
+    out = Path(args.out)
+    out.mkdir(parents=True, exist_ok=True)
+    if args.stats:
+        snapshots = list(zip(snapshot_labels(args.stats), args.stats))
+    else:
+        from app.utils.stats import get_all_stats
+        stats = get_all_stats(args.year)
+        # Keep the numbers behind the cards; a fleet export takes these back via --stats.
+        save_snapshot(stats, out / "stats.json")
+        snapshots = [("stats", stats)]
+    written = export_cards(snapshots, out, args.format, args.workers, (args.width, args.height))
+    print(f"Wrote {len(written)} {args.format} cards to {out}")
+
+def collect(args):
+    from app.utils.session_store import collect as collect_sessions
+    added = collect_sessions(args.db)
+    if not args.quiet:
+        print(f"Collected {added} new sessions")
+
+def convert(args):
+    from app.utils.columnar import convert_db
+    from app.utils.session_store import session_store_path
+    from app.utils.screen_time import get_screen_time_db_path
+    store = session_store_path()
+    db = args.db or (store if store.exists() else get_screen_time_db_path())
+    if not db:
+        print("No Screen Time database or session store found")
+        return
+    months = convert_db(db, args.out)
+    print(f"Added {sum(months.values())} new sessions to {len(months)} monthly column files")
+
+def watch(args):
+    from app.utils.live import LiveUsage, open_live_db
+    from app.utils.screen_time import get_screen_time_db_path
+    from app.utils.session_store import session_store_path
+    store = session_store_path()
+    db = args.db or get_screen_time_db_path() or (store if store.exists() else None)
+    if not db:
+        print("No Screen Time database or session store found")
+        return
+    from app.watch_app import MacWrapWatch
+    MacWrapWatch(LiveUsage(open_live_db(db)), args.interval).run()
+
+def write_to_stdout(write, header, rows):
+    # `macwrap query ... | head` closes the pipe early; exit quietly instead
+    # of a traceback, pointing stdout at devnull so the interpreter's final
+    # flush doesn't raise again.
+    try:
+        write(header, rows, sys.stdout)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(1)
+
+def query(args):
+    from app.utils.query import parse_query, QueryError, header, sql_rows, column_rows, WRITERS
+    try:
+        q = parse_query(" ".join(args.expression))
+    except QueryError as e:
+        sys.exit(f"macwrap query: {e}")
+    write = WRITERS[args.format]
+
+    from app.utils.screen_time import get_screen_time_db_path
+    from app.utils.session_store import session_store_path, open_source_db
+    store = session_store_path()
+    db = args.db or (store if store.exists() else get_screen_time_db_path())
+
+    if args.source != "sqlite" and not args.db:
+        from app.utils.columnar import columns_dir, columns_current, DICTIONARY
+        root = columns_dir()
+        # Auto mode falls back to SQLite once `collect` has moved the store
+        # past the last `convert`; --source columns takes the files as they are.
+        if (root / DICTIONARY).exists() and (args.source == "columns" or not db or columns_current(root, db)):
+            write_to_stdout(write, header(q), column_rows(root, q))
+            return
+        if args.source == "columns":
+            sys.exit("macwrap query: no column files yet; run 'macwrap convert' first")
+
+    if not db:
+        sys.exit("macwrap query: no Screen Time database or session store found")
+    with open_source_db(db) as conn:
+        write_to_stdout(write, header(q), sql_rows(conn, q))
+
+def main():
+    parser = argparse.ArgumentParser(prog="macwrap", description="Your Mac. Wrapped.")
+    motion = parser.add_mutually_exclusive_group()
+    motion.add_argument("--reduced-motion", action="store_true",
+                        help="paint each slide once instead of animating it (auto-enabled over SSH/tmux)")
+    motion.add_argument("--full-motion", action="store_true",
+                        help="always animate, even when a low-bandwidth terminal is detected")
+    commands = parser.add_subparsers(dest="command")
+
+    export_parser = commands.add_parser("export", help="render every slide to share cards")
+    export_parser.add_argument("--format", choices=("svg", "ansi", "txt"), default="svg")
+    export_parser.add_argument("--out", required=True, help="directory to write the cards to")
+    export_parser.add_argument("--stats", nargs="+", metavar="JSON",
+                               help="stats snapshots to export instead of this Mac (one subdirectory each)")
+    export_parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    export_parser.add_argument("--width", type=int, default=100)
+    export_parser.add_argument("--height", type=int, default=40)
+    export_parser.add_argument("--year", type=int, default=2025)
+    export_parser.set_defaults(run=export)
+
+    collect_parser = commands.add_parser("collect", help="copy new Screen Time sessions into macwrap's own store")
+    collect_parser.add_argument("--db", help="knowledgeC.db to read (default: this Mac's)")
+    collect_parser.add_argument("--quiet", action="store_true")
+    collect_parser.set_defaults(run=collect)
+
+    convert_parser = commands.add_parser("convert", help="write sessions as columnar monthly files")
+    convert_parser.add_argument("--db", help="database to read (default: the session store, else knowledgeC.db)")
+    convert_parser.add_argument("--out", help="output directory (default: columns/ in macwrap's data dir)")
+    convert_parser.set_defaults(run=convert)
+
+    watch_parser = commands.add_parser("watch", help="live dashboard of today's and this week's usage")
+    watch_parser.add_argument("--db", help="database to watch (default: knowledgeC.db, else the session store)")
+    watch_parser.add_argument("--interval", type=float, default=2.0, help="seconds between change checks")
+    watch_parser.set_defaults(run=watch)
+
+    query_parser = commands.add_parser("query", help="ad-hoc grouped usage queries",
+                                       description="e.g. macwrap query by app, weekday app chrome from 2025-01-01 order hours desc limit 10")
+    query_parser.add_argument("expression", nargs="*", help="by KEYS / app PATTERN / from DATE / to DATE / order FIELD [asc|desc] / limit N")
+    query_parser.add_argument("--format", choices=("table", "csv", "json"), default="table")
+    query_parser.add_argument("--source", choices=("auto", "sqlite", "columns"), default="auto",
+                              help="auto scans the column files when they are up to date, else queries SQLite")
+    query_parser.add_argument("--db", help="SQLite database to query (implies --source sqlite)")
+    query_parser.set_defaults(run=query)
+    args = parser.parse_args()
+
+    if args.command:
+        from app.utils.screen_time import FULL_DISK_ACCESS_HELP, access_denied
+        try:
+            args.run(args)
+        except (sqlite3.Error, OSError) as e:
+            message = f"macwrap {args.command}: {e}"
+            if access_denied(e):
+                message += "\n\n" + FULL_DISK_ACCESS_HELP
+            sys.exit(message)
+        return
+
+    reduced_motion = args.reduced_motion or (not args.full_motion and detect_low_bandwidth())
+    if reduced_motion:
+        # Textual reads this once at import time, so set it before importing the app.
+        os.environ.setdefault("TEXTUAL_FPS", str(REDUCED_MOTION_FPS))
+
+    from app.macwrap_app import MacWrap
+    MacWrap(reduced_motion=reduced_motion).run()
 
 if __name__ == "__main__":
-    MacWrap().run()
+    main()
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Run from anywhere: make the repo root importable, like the benchmarks do.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
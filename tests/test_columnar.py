@@ -0,0 +1,35 @@
+import struct
+from app.utils.columnar import MonthColumns, app_totals, columns_current, convert_db, convert_sessions
+from app.utils.session_store import open_session_store
+
+JAN = 1735689600  # 2025-01-01 00:00 UTC
+
+def test_reconvert_merges_and_dedupes(tmp_path):
+    assert convert_sessions([("a", JAN, JAN + 60), ("b", JAN + 100, JAN + 130)], tmp_path) == {"2025-01": 2}
+    # One repeat and one new session.
+    assert convert_sessions([("a", JAN, JAN + 60), ("a", JAN + 200, JAN + 260)], tmp_path) == {"2025-01": 1}
+    assert app_totals(2025, tmp_path) == {"a": (120, 2), "b": (30, 1)}
+
+def test_close_with_exported_buffer(tmp_path):
+    convert_sessions([("a", JAN, JAN + 60)], tmp_path)
+    month = MonthColumns(tmp_path / "2025-01.cols")
+    # Holds a buffer on the starts column, as a NumPy array from arrays() does.
+    held = struct.iter_unpack("<q", month.starts)
+    month.close()
+    assert next(held) == (JAN,)
+
+def test_columns_go_stale_after_collect(tmp_path):
+    store = tmp_path / "sessions.db"
+    conn = open_session_store(store)
+    with conn:
+        conn.execute("INSERT INTO ZOBJECT (ZSTREAMNAME, ZVALUESTRING, ZSTARTDATE, ZENDDATE) VALUES ('/app/usage', 'a', 100, 160)")
+    root = tmp_path / "columns"
+    assert not columns_current(root, store)
+    convert_db(store, root)
+    assert columns_current(root, store)
+    with conn:
+        conn.execute("INSERT INTO ZOBJECT (ZSTREAMNAME, ZVALUESTRING, ZSTARTDATE, ZENDDATE) VALUES ('/app/usage', 'a', 200, 260)")
+    conn.close()
+    assert not columns_current(root, store)
+    convert_db(store, root)
+    assert columns_current(root, store)
@@ -0,0 +1,40 @@
+from collections import Counter
+from app.utils import command_trie
+
+def counts(trie):
+    found = {}
+    def walk(children, path):
+        for token, (count, grandchildren) in children.items():
+            found[path + (token,)] = count
+            walk(grandchildren, path + (token,))
+    walk(trie["root"], ())
+    return found
+
+def test_prune_keeps_heavy_prefixes_and_their_counts():
+    lines = Counter()
+    lines["git status"] = 500
+    lines["git commit -m x"] = 300
+    lines["docker compose up"] = 200
+    # A long tail of one-off commands, far past MAX_NODES.
+    for i in range(3 * command_trie.MAX_NODES):
+        lines[f"tool{i} run"] = 1
+    trie = command_trie.new_trie()
+    command_trie.add_lines(trie, lines.items())
+
+    assert trie["size"] <= command_trie.MAX_NODES
+    assert trie["size"] == command_trie._size(trie["root"])
+    kept = counts(trie)
+    # Surviving nodes keep their exact counts.
+    assert kept[("git",)] == 800
+    assert kept[("git", "status")] == 500
+    assert kept[("git", "commit")] == 300
+    assert kept[("docker", "compose", "up")] == 200
+    assert not any(path[0].startswith("tool") for path in kept)
+    assert command_trie.top(trie, n=2) == [("git", 800, [("status", 500), ("commit", 300)]), ("docker", 200, [("compose", 200)])]
+
+def test_merge_preserves_counts():
+    a, b = command_trie.new_trie(), command_trie.new_trie()
+    command_trie.add_lines(a, [("git status", 2), ("git", 1)])
+    command_trie.add_lines(b, [("git status", 3), ("ls -la", 4)])
+    merged = counts(command_trie.merge(command_trie.merge(command_trie.new_trie(), a), b))
+    assert merged == {("git",): 6, ("git", "status"): 5, ("ls",): 4}
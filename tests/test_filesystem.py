@@ -0,0 +1,58 @@
+import time
+from app.utils.filesystem import mdfind_file_creation_stats, scan_file_creation_stats
+
+def fake_mdfind(tmp_path, body):
+    script = tmp_path / "mdfind"
+    script.write_text("#!/bin/sh\n" + body)
+    script.chmod(0o755)
+    return str(script)
+
+def test_streams_counts(tmp_path):
+    mdfind = fake_mdfind(tmp_path, (
+        "echo /Users/me/a.py\n"
+        "echo /Users/me/b.PY\n"
+        "echo /Users/me/notes.md\n"
+        "echo /Users/me/Makefile\n"
+        "echo\n"
+    ))
+    stats = mdfind_file_creation_stats(2025, deadline=5, mdfind=mdfind)
+    assert stats["total"] == 4
+    assert stats["top_types"] == [(".py", 2), (".md", 1)]
+    assert stats["truncated"] is False
+
+def test_missing_binary_returns_none(tmp_path):
+    assert mdfind_file_creation_stats(2025, mdfind=str(tmp_path / "no-such-mdfind")) is None
+
+def test_deadline_keeps_partial_counts(tmp_path):
+    mdfind = fake_mdfind(tmp_path, (
+        "echo /Users/me/a.txt\n"
+        "echo /Users/me/b.txt\n"
+        "sleep 30\n"
+        "echo /Users/me/never.txt\n"
+    ))
+    start = time.monotonic()
+    stats = mdfind_file_creation_stats(2025, deadline=0.5, mdfind=mdfind)
+    assert time.monotonic() - start < 10
+    assert stats["total"] == 2
+    assert stats["top_types"] == [(".txt", 2)]
+    assert stats["truncated"] is True
+
+def test_scan_deadline_builds_on_index(tmp_path):
+    root = tmp_path / "home"
+    (root / "a" / "b").mkdir(parents=True)
+    (root / "top.txt").write_text("x")
+    (root / "a" / "b" / "deep.txt").write_text("x")
+    index = tmp_path / "index.bin"
+    year = time.localtime().tm_year
+    # Cut off after the root: what was visited is still indexed.
+    stats = scan_file_creation_stats(year, [root], index_file=index, deadline=0)
+    assert stats["total"] == 1
+    assert stats["truncated"] is True
+    assert index.exists()
+    stats = scan_file_creation_stats(year, [root], index_file=index)
+    assert stats["total"] == 2
+    assert stats["truncated"] is False
+    # Unreached directories are answered from the index.
+    stats = scan_file_creation_stats(year, [root], index_file=index, deadline=0)
+    assert stats["total"] == 2
+    assert stats["truncated"] is True
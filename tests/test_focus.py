@@ -0,0 +1,52 @@
+from app.utils.focus import FOCUS_GAP, FOCUS_MIN_HOURS, FOCUS_SHARE, FocusBlocks
+
+HOUR = 3600
+MIN = FOCUS_MIN_HOURS * HOUR
+
+def run(sessions):
+    blocks = FocusBlocks()
+    for app, start, end in sessions:
+        blocks.add(app, start, end)
+    return blocks.summary()
+
+def test_min_hours_boundary():
+    assert run([("a", 0, MIN)])["focus_sessions"] == 1
+    assert run([("a", 0, MIN - 1)])["focus_sessions"] == 0
+
+def test_gap_boundary():
+    half = MIN // 2
+    # Pauses just under FOCUS_GAP join the block, a pause of FOCUS_GAP ends it.
+    joined = run([("a", 0, half), ("a", half + FOCUS_GAP - 1, MIN + FOCUS_GAP)])
+    assert joined["focus_sessions"] == 1
+    split = run([("a", 0, half), ("a", half + FOCUS_GAP, MIN + FOCUS_GAP)])
+    assert split["focus_sessions"] == 0
+
+def test_other_apps_inside_the_gap():
+    half = MIN // 2
+    # Another app used for less than FOCUS_GAP in between keeps the block open.
+    brief = run([("a", 0, half), ("b", half, half + FOCUS_GAP - 1), ("a", half + FOCUS_GAP - 1, MIN + 600)])
+    assert brief["focus_sessions"] == 1
+    # FOCUS_GAP of other-app time closes it even when the wall-clock pause
+    # is shorter (sessions of other apps overlapping each other).
+    pause = FOCUS_GAP * 2 // 3
+    sessions = [("a", 0, half), ("b", half, half + pause), ("c", half, half + pause), ("a", half + pause, MIN + pause)]
+    assert run(sessions)["focus_sessions"] == 0
+
+def test_share_boundary():
+    # One long block whose own time is just at / just under FOCUS_SHARE of
+    # its span, with the rest spread as other-app time under FOCUS_GAP each.
+    def block(own_share):
+        span = 10 * HOUR
+        step = 200
+        own = int(step * own_share)
+        sessions = []
+        for start in range(0, span, step):
+            sessions.append(("a", start, start + own))
+            sessions.append(("b", start + own, start + step))
+        return run(sessions)
+    assert block(FOCUS_SHARE)["top_focus_apps"][0][0] == "A"
+    assert block(FOCUS_SHARE - 0.05)["focus_sessions"] == 0
+
+def test_alternating_apps_are_not_focus():
+    sessions = [("ab"[i % 2], i * 180, i * 180 + 180) for i in range(80)]
+    assert run(sessions)["focus_hours"] == 0
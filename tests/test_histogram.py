@@ -0,0 +1,34 @@
+import random
+from app.utils.histogram import BUCKETS, MAX_SECONDS, SUB, LogHistogram, bucket, bucket_bounds
+
+def test_buckets_cover_every_value_once():
+    previous_high = 0
+    for index in range(BUCKETS):
+        low, high = bucket_bounds(index)
+        assert low == previous_high
+        assert bucket(low) == bucket(high - 1) == index
+        # Exact below SUB, then never wider than 1/SUB of the values in it.
+        assert high - low == 1 if low < SUB else (high - low) * SUB <= low
+        previous_high = high
+    assert previous_high == MAX_SECONDS
+
+def test_percentiles_within_bucket_error():
+    rng = random.Random(3)
+    values = sorted(int(rng.expovariate(1 / 600)) for _ in range(20000))
+    histogram = LogHistogram()
+    for value in values:
+        histogram.add(value)
+    for q in (0.5, 0.9, 0.99):
+        exact = values[round(q * len(values)) - 1]
+        assert abs(histogram.percentile(q) - exact) <= max(1, exact / SUB)
+
+def test_merge_and_round_trip():
+    a, b = LogHistogram(), LogHistogram()
+    for seconds in (1, 5, 100, 3600):
+        a.add(seconds)
+    for seconds in (7, 100, MAX_SECONDS * 2, -5):
+        b.add(seconds)
+    merged = LogHistogram.from_dict(a.to_dict()).merge(LogHistogram.from_dict(b.to_dict()))
+    assert merged.total == 8
+    assert list(merged.counts) == [x + y for x, y in zip(a.counts, b.counts)]
+    assert LogHistogram().percentile(0.5) == 0
@@ -0,0 +1,110 @@
+import os
+import time
+import pytest
+from app.utils.history import ELAPSED_LABELS, collect_history, command_stats, parse_history_file
+
+TS = 1736000000  # 2025-01-04 14:13:20 UTC
+
+@pytest.fixture(autouse=True)
+def utc(monkeypatch):
+    monkeypatch.setenv("TZ", "UTC")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+def write(path, text):
+    path.write_bytes(text.encode())
+    return path
+
+def year(summary, y=2025):
+    return summary["years"][y]
+
+def top(summary):
+    return {cmd: n for cmd, n, _ in command_stats(summary, 2025)["top_commands"]}
+
+def test_zsh_extended(tmp_path):
+    history = write(tmp_path / ".zsh_history", (
+        f": {TS}:0;git status\n"
+        f": {TS + 60}:45;make \\\n"
+        "  test\n"
+        f": {TS + 3600}:2000;git push\n"
+    ))
+    summary, end = parse_history_file(history)
+    assert end == history.stat().st_size
+    entry = year(summary)
+    # The continuation line belongs to "make", it isn't a command of its own.
+    assert entry["count"] == 3
+    assert entry["hours"][14] == 2 and entry["hours"][15] == 1
+    elapsed = dict(zip(ELAPSED_LABELS, entry["elapsed"]))
+    assert elapsed["<1s"] == 1 and elapsed["30s-1m"] == 1 and elapsed["30m+"] == 1
+    assert top(summary) == {"git": 2, "make": 1}
+    assert summary["undated"] == 0
+
+def test_bash_timestamps(tmp_path):
+    history = write(tmp_path / ".bash_history", f"#{TS}\nls -la\n#{TS + 10}\ngit log\n")
+    summary, _ = parse_history_file(history)
+    assert year(summary)["count"] == 2
+    assert top(summary) == {"ls": 1, "git": 1}
+
+def test_fish_with_and_without_when(tmp_path):
+    history = write(tmp_path / "fish_history", (
+        f"- cmd: git status\n  when: {TS}\n"
+        "- cmd: ls\n"
+        f"- cmd: cargo build\n  when: {TS + 5}\n  paths:\n    - src\n"
+    ))
+    summary, _ = parse_history_file(history)
+    assert year(summary)["count"] == 2
+    assert summary["undated"] == 1
+
+def test_plain_lines_and_continuations(tmp_path):
+    history = write(tmp_path / ".history", "ls\nmake \\\n  all\ngit status\n")
+    summary, _ = parse_history_file(history)
+    assert summary["undated"] == 3
+    assert summary["years"] == {}
+
+def test_timestamps_switched_on_later(tmp_path):
+    # Far more than the head sample of plain history, then EXTENDED_HISTORY.
+    plain = "".join(f"echo {i}\n" for i in range(2000))
+    history = write(tmp_path / ".zsh_history", plain + f": {TS}:0;git status\n: {TS + 1}:0;ls\n")
+    summary, _ = parse_history_file(history)
+    assert summary["undated"] == 2000
+    assert year(summary)["count"] == 2
+
+def test_incomplete_last_line_waits(tmp_path):
+    history = write(tmp_path / ".zsh_history", f": {TS}:0;ls\n: {TS + 1}:0;git st")
+    summary, end = parse_history_file(history)
+    assert year(summary)["count"] == 1
+    assert end == len(f": {TS}:0;ls\n")
+
+def test_index_parses_only_appended_bytes(tmp_path):
+    history = write(tmp_path / ".zsh_history", f": {TS}:0;ls\n")
+    index = tmp_path / "index.json"
+    assert year(collect_history([history], index))["count"] == 1
+    with open(history, "a") as f:
+        f.write(f": {TS + 1}:0;git status\n")
+    assert year(collect_history([history], index))["count"] == 2
+    assert year(collect_history([history], index))["count"] == 2
+
+def test_index_rescans_file_rewritten_in_place(tmp_path):
+    history = write(tmp_path / ".zsh_history", "".join(f": {TS + i}:0;ls {i}\n" for i in range(10)))
+    index = tmp_path / "index.json"
+    assert year(collect_history([history], index))["count"] == 10
+    inode = history.stat().st_ino
+    # Same inode, at least as long as before, different bytes before the offset.
+    with open(history, "r+") as f:
+        f.write("".join(f": {TS + i}:0;git status {i}\n" for i in range(12)))
+    assert history.stat().st_ino == inode
+    summary = collect_history([history], index)
+    assert year(summary)["count"] == 12
+    assert top(summary) == {"git": 12}
+
+def test_index_rescans_truncated_file(tmp_path):
+    history = write(tmp_path / ".zsh_history", "".join(f": {TS + i}:0;ls\n" for i in range(10)))
+    index = tmp_path / "index.json"
+    assert year(collect_history([history], index))["count"] == 10
+    with open(history, "r+") as f:
+        f.truncate(len(f": {TS}:0;ls\n") * 3)
+    assert year(collect_history([history], index))["count"] == 3
+    os.remove(history)
+    assert collect_history([history], index)["years"] == {}
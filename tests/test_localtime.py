@@ -0,0 +1,26 @@
+import time
+import pytest
+from app.utils.localtime import LocalClock, QUARTER_HOUR
+
+@pytest.fixture
+def kolkata(monkeypatch):
+    monkeypatch.setenv("TZ", "Asia/Kolkata")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+def test_half_hour_offset(kolkata):
+    clock = LocalClock(lambda t: (t.tm_mday, t.tm_hour))
+    # 2024-12-31 18:29 and 18:30 UTC are 23:59 and 00:00 the next day in +05:30.
+    before, after = 1735669740, 1735669800
+    assert clock(before) == (31, 23)
+    assert clock(after) == (1, 0)
+    assert clock.quarter(after // QUARTER_HOUR) == (1, 0)
+
+def test_fields_cached_per_quarter_hour():
+    calls = []
+    clock = LocalClock(lambda t: calls.append(t) or t.tm_hour)
+    for seconds in range(0, 2 * QUARTER_HOUR, 60):
+        clock(seconds)
+    assert len(calls) == 2
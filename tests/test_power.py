@@ -0,0 +1,34 @@
+from app.utils.power import parse_pmset_lines, summarize_power_events
+
+def line(stamp, kind, message):
+    return f"2025-{stamp} +0100 {kind:<20}\t{message}\n"
+
+def reboots(lines):
+    return summarize_power_events(parse_pmset_lines(lines, 2025))["reboots"]
+
+def test_restart_counts_once():
+    assert reboots([
+        line("03-01 10:00:00", "Restart", "Restart requested"),
+        line("03-01 10:00:41", "Shutdown Cause", "Shutdown Cause=5"),
+    ]) == 1
+
+def test_restart_waiting_at_unlock_counts_once():
+    # FileVault holds the boot at the unlock screen for as long as it takes.
+    assert reboots([
+        line("03-01 10:00:00", "Restart", "Restart requested"),
+        line("03-01 10:25:00", "Shutdown Cause", "Shutdown Cause=5"),
+    ]) == 1
+
+def test_overnight_shutdown_counts_once():
+    assert reboots([
+        line("03-01 23:00:00", "Shutdown", "Shutdown requested"),
+        line("03-02 08:30:00", "Shutdown Cause", "Shutdown Cause=5"),
+    ]) == 1
+
+def test_crash_without_shutdown_line_counts():
+    assert reboots([
+        line("03-01 10:00:00", "Sleep", "Entering Sleep state due to 'Idle Sleep' Using AC\t100 secs"),
+        line("03-02 10:00:00", "Shutdown Cause", "Shutdown Cause=-128"),
+        line("03-03 10:00:00", "Restart", "Restart requested"),
+        line("03-03 10:00:30", "Shutdown Cause", "Shutdown Cause=5"),
+    ]) == 2
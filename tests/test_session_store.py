@@ -0,0 +1,46 @@
+import sqlite3
+from app.utils.session_store import collect, open_usage_db
+
+def knowledge_db(path, rows):
+    # rows: (Z_PK, app, start); just the ZOBJECT columns the store copies.
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE ZOBJECT (Z_PK INTEGER PRIMARY KEY, ZSTREAMNAME TEXT,"
+        " ZVALUESTRING TEXT, ZSTARTDATE REAL, ZENDDATE REAL)"
+    )
+    conn.executemany(
+        "INSERT INTO ZOBJECT VALUES (?, '/app/usage', ?, ?, ?)",
+        [(pk, app, start, start + 60) for pk, app, start in rows],
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+def stored(store):
+    conn = sqlite3.connect(store)
+    try:
+        return sorted(conn.execute("SELECT ZVALUESTRING, ZSTARTDATE FROM ZOBJECT"))
+    finally:
+        conn.close()
+
+def test_collect_is_incremental(tmp_path):
+    store = tmp_path / "sessions.db"
+    db = knowledge_db(tmp_path / "knowledgeC.db", [(1, "a", 100), (2, "b", 200)])
+    assert collect(db, store) == 2
+    assert collect(db, store) == 0
+
+def test_switching_source_resets_the_mark(tmp_path):
+    store = tmp_path / "sessions.db"
+    first = knowledge_db(tmp_path / "first.db", [(10, "a", 100), (11, "a", 200)])
+    # A new row below the first database's mark, one above it, and one row
+    # the store already has.
+    second = knowledge_db(tmp_path / "second.db", [(1, "a", 100), (5, "b", 300), (20, "c", 400)])
+    assert collect(first, store) == 2
+    assert collect(second, store) == 2
+    assert stored(store) == [("a", 100.0), ("a", 200.0), ("b", 300.0), ("c", 400.0)]
+
+def test_failed_collect_still_reads_the_store(tmp_path):
+    store = tmp_path / "sessions.db"
+    collect(knowledge_db(tmp_path / "knowledgeC.db", [(1, "a", 100)]), store)
+    with open_usage_db(tmp_path / "missing.db", store) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM ZOBJECT").fetchone()[0] == 1
@@ -0,0 +1,56 @@
+import asyncio
+import io
+from rich.console import Console
+from app.macwrap_app import MacWrap
+from app.screens.slide import SlideScreen, build
+from app.screens.story import STORY
+from benchmarks.fixtures import sample_stats
+
+def plain(renderable):
+    console = Console(width=100, file=io.StringIO(), record=True)
+    console.print(renderable)
+    return console.export_text()
+
+def play(steps, monkeypatch):
+    """Press keys through the story; returns (slide, content, running) after each press."""
+    # Hold auto-advancing slides so every transition comes from a key.
+    monkeypatch.setattr(SlideScreen, "AUTO_ADVANCE", False)
+    seen = []
+
+    async def main():
+        app = MacWrap(stats=sample_stats(), reduced_motion=True)
+        async with app.run_test(size=(100, 40)) as pilot:
+            await pilot.pause()
+            screen = app.screen
+            seen.append((screen.slide["name"], plain(screen.query_one("#slide").content), True))
+            for key in steps:
+                await pilot.press(key)
+                await pilot.pause()
+                seen.append((screen.slide["name"], plain(screen.query_one("#slide").content), app.is_running))
+                if not app.is_running:
+                    break
+
+    asyncio.run(main())
+    return seen
+
+def test_forward_through_the_story(monkeypatch):
+    keys = ["right", "enter", "space"]
+    seen = play([keys[i % 3] for i in range(len(STORY) - 1)], monkeypatch)
+    assert [name for name, _, _ in seen] == [slide["name"] for slide in STORY]
+    stats = sample_stats()
+    for name, content, running in seen:
+        assert running
+        # The slide on screen is the new one as soon as the key is handled.
+        assert content == plain(build(name, stats))
+
+def test_back_skips_auto_advancing_slides(monkeypatch):
+    seen = play(["right", "right", "right", "left", "backspace", "left"], monkeypatch)
+    names = [name for name, _, _ in seen]
+    assert names == ["intro", "loading", "total_time", "top_apps", "total_time", "total_time", "total_time"]
+
+def test_only_space_exits_the_credits(monkeypatch):
+    steps = ["right"] * (len(STORY) - 1) + ["enter", "right", "left", "right", "space"]
+    seen = play(steps, monkeypatch)
+    names = [name for name, _, _ in seen]
+    assert names[len(STORY) - 1:] == ["credits", "credits", "credits", "finale", "credits", "credits"]
+    assert [running for _, _, running in seen[len(STORY) - 1:]] == [True, True, True, True, True, False]
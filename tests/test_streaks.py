@@ -0,0 +1,43 @@
+import random
+from app.utils.streaks import DayOccupancy, day_stats, longest_run
+
+def bits_of(days):
+    bits = 0
+    for day in days:
+        bits |= 1 << day
+    return bits
+
+def walk(bits):
+    # Day-by-day reference for longest_run.
+    best = run = 0
+    while bits:
+        run = run + 1 if bits & 1 else 0
+        best = max(best, run)
+        bits >>= 1
+    return best
+
+def test_longest_run_matches_walk():
+    rng = random.Random(7)
+    assert longest_run(0) == 0
+    assert longest_run(1) == 1
+    assert longest_run((1 << 366) - 1) == 366
+    for _ in range(500):
+        bits = rng.getrandbits(366) & rng.getrandbits(366) | bits_of(range(rng.randrange(300), rng.randrange(300, 366)))
+        assert longest_run(bits) == walk(bits)
+
+def test_day_stats():
+    bits = bits_of([0, 1, 2, 10, 11, 19, 20])
+    longest, current, gap, active = day_stats(bits, last_day=20)
+    assert (longest, current, gap, active) == (3, 2, 7, 7)
+    # Today not used yet: the streak through yesterday still counts.
+    assert day_stats(bits, last_day=21)[1] == 2
+    assert day_stats(bits, last_day=22)[1] == 0
+    assert day_stats(0, 10) == (0, 0, 0, 0)
+
+def test_session_across_midnight_marks_both_days():
+    occupancy = DayOccupancy(2025)
+    start = occupancy.start + 86400 - 60
+    occupancy.add("a", start, start + 120)
+    assert occupancy.bits["a"] == 0b11
+    occupancy.add("b", occupancy.start - 3600, occupancy.start - 60)
+    assert "b" not in occupancy.bits
@@ -0,0 +1,36 @@
+import pytest
+from app.utils import timeline
+
+WAKE = 1735725600  # 2025-01-01 10:00 UTC
+
+def fake_log(*lines):
+    def stream():
+        yield from lines
+    return stream
+
+def missing_pmset():
+    raise FileNotFoundError("pmset")
+    yield
+
+def test_missing_pmset_gives_empty_timeline(monkeypatch):
+    monkeypatch.setattr(timeline, "stream_pmset_log", missing_pmset)
+    power, awake = timeline.get_power_timeline(2025, iter([("a", WAKE, WAKE + 60)]))
+    assert power == {"sleeps": 0, "wakes": 0, "reboots": 0}
+    assert awake == {}
+
+def test_session_errors_propagate(monkeypatch):
+    monkeypatch.setattr(timeline, "stream_pmset_log", fake_log(
+        "2025-01-01 10:00:00 +0000 Wake                \tWake from Deep Idle due to EC.LidOpen Using AC\t5 secs\n",
+        "2025-01-01 12:00:00 +0000 Sleep               \tEntering Sleep state due to Idle Using AC\t100 secs\n",
+    ))
+
+    def sessions():
+        yield ("a", WAKE + 10, WAKE + 100)
+        raise RuntimeError("observer failed")
+
+    with pytest.raises(RuntimeError):
+        timeline.get_power_timeline(2025, sessions())
+    power, awake = timeline.get_power_timeline(2025, iter([("a", WAKE + 10, WAKE + 100)]))
+    assert power["wakes"] == 1 and power["sleeps"] == 1
+    assert awake["awake_hours"] == 2.0
+    assert awake["avg_wake_to_app_seconds"] == 10.0